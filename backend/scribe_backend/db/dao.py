@@ -1,10 +1,15 @@
 """Database Access Object for Scribe"""
 
+import os
 import sqlite3
 import asyncio
+import collections
+import contextlib
+import contextvars
+import functools
 import threading
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Dict, Any
+import time
 import uuid
 import logging
 from concurrent.futures import ThreadPoolExecutor
@@ -13,8 +18,117 @@ from .init_db import get_db_path, init_database
 
 logger = logging.getLogger(__name__)
 
-# Number of reader connections in the pool.
-_READER_POOL_SIZE = 4
+# Maximum number of pooled reader connections (and concurrent reads).
+# WAL readers never block each other, so this can be well above the core
+# count; override with SCRIBE_DB_READERS.
+_READER_POOL_SIZE = int(os.environ.get(
+    'SCRIBE_DB_READERS', min(32, (os.cpu_count() or 1) * 4)
+))
+
+# Size of each connection's prepared-statement LRU (sqlite3 default: 128).
+# sqlite3 keys this cache by SQL text, so the fixed query strings used
+# below are only compiled once per connection.
+_STATEMENT_CACHE_SIZE = 256
+
+# ``UPDATE ... FROM`` needs SQLite 3.33+.
+_HAS_UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+
+# Rows per ``UPDATE ... FROM (VALUES ...)`` statement.  Each row binds two
+# parameters, keeping statements under SQLite's historical 999-variable
+# limit.
+_EDIT_CHUNK_SIZE = 400
+
+# Set to the open transaction's token in the task that opened it.  Tasks
+# created inside the block (asyncio.gather, create_task) inherit it, which
+# is how their writes are told apart from unrelated ones: they would wait
+# for a transaction that is itself waiting on them.
+_TX_CONTEXT: contextvars.ContextVar = contextvars.ContextVar(
+    'scribe_db_transaction', default=None
+)
+
+# Rows fetched per round trip by iter_segments.
+_SEGMENT_BATCH_SIZE = 256
+
+# Maximum number of queued writes applied under a single group commit.
+_GROUP_COMMIT_MAX = 64
+
+# Buffered progress updates are written at most this often (seconds).
+_PROGRESS_FLUSH_INTERVAL = 0.25
+
+# Pragmas applied to every connection, in order.
+# - synchronous=NORMAL: under WAL this only fsyncs at checkpoints, so a
+#   power loss can drop the last transaction but never corrupts the DB.
+# - cache_size: negative value is KiB, i.e. a 64 MB page cache.
+# - mmap_size: 256 MB memory-mapped I/O, shared across connections.
+# - busy_timeout: wait up to 5 s for a lock instead of failing with
+#   SQLITE_BUSY immediately.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Connections return plain tuples; these column tuples turn a row into a
+# dict with a single dict(zip(...)) instead of going through sqlite3.Row.
+_JOB_COLUMNS = (
+    'job_id', 'status', 'audio_path', 'model', 'language', 'translate',
+    'progress', 'error', 'created_at', 'updated_at',
+)
+_SEGMENT_COLUMNS = ('idx', 'start', 'end', 'text', 'edited_text')
+
+_JOB_SELECT = f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs"
+
+# edited_text comes back as '' rather than NULL for unedited segments.
+_SEGMENTS_QUERY = """
+SELECT idx, start, end, text, COALESCE(edited_text, '')
+FROM transcript_segments
+WHERE job_id = ? AND idx > ?
+ORDER BY idx
+"""
+
+# One keyset page of _SEGMENTS_QUERY; see iter_segments.
+_SEGMENTS_PAGE_QUERY = _SEGMENTS_QUERY + "LIMIT ?\n"
+
+# (epoch_second, "YYYY-MM-DDTHH:MM:SS") for the most recent _now_iso() call.
+# Stored as a single tuple so concurrent threads never see a torn update.
+_iso_second_cache: tuple = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    Produces the same shape as ``datetime.now(timezone.utc).isoformat()``
+    but only formats the date/time prefix once per second; the sub-second
+    part is appended from ``time.time_ns()``.
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+def _writer(method):
+    """Run a synchronous DAO method on the writer thread.
+
+    The decorated method becomes a coroutine that hands ``method`` itself
+    to ``Database._submit_write`` -- no per-call closure -- so it takes
+    part in group commits and open ``transaction()`` blocks.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if kwargs:
+            return await self._submit_write(
+                functools.partial(method, self, *args, **kwargs)
+            )
+        return await self._submit_write(method, self, *args)
+    return wrapper
 
 
 class Database:
@@ -27,9 +141,13 @@ class Database:
 
     - **Writer**: 1 persistent connection, serialised through a 1-worker
       ThreadPoolExecutor.
-    - **Reader pool**: N persistent connections (one per thread), served by
-      an N-worker ThreadPoolExecutor.  A ``threading.local`` ensures each
-      thread gets its own connection.
+    - **Reader pool**: up to N persistent connections, checked out per
+      read and run via ``asyncio.to_thread``.  An ``asyncio.Semaphore``
+      bounds concurrency to the pool size.  Used for potentially large
+      reads such as ``get_segments``.
+    - **Inline reader**: 1 connection used directly on the event loop
+      thread for point lookups (jobs, settings) that return a handful of
+      rows, skipping the executor hop entirely.
     """
 
     def __init__(self):
@@ -43,87 +161,323 @@ class Database:
             max_workers=1, thread_name_prefix="db-writer"
         )
         self._writer_conn: Optional[sqlite3.Connection] = None
-
-        # Reader pool: N connections, N workers
-        self._read_executor = ThreadPoolExecutor(
-            max_workers=_READER_POOL_SIZE, thread_name_prefix="db-reader"
+        # Held for the duration of a transaction() block; _tx_task is the
+        # task that owns it, whose writes skip their individual commits.
+        self._tx_lock = asyncio.Lock()
+        self._tx_task: Optional[asyncio.Task] = None
+        self._tx_token: Optional[object] = None
+        # Group commit: writes queue up here and a single consumer task
+        # applies everything that accumulated under one commit.
+        self._write_queue: collections.deque = collections.deque()
+        self._group_commit_task: Optional[asyncio.Task] = None
+        self._in_group_commit = False
+
+        # Reader pool: connections are created on demand up to the
+        # semaphore limit and returned to the idle list after each read.
+        # The idle list is only touched from the event loop thread.
+        self._reader_slots = asyncio.Semaphore(_READER_POOL_SIZE)
+        self._idle_readers: List[sqlite3.Connection] = []
+
+        # Reader used directly on the event loop thread for point lookups
+        self._loop_conn: Optional[sqlite3.Connection] = None
+        # get_segments reads in flight, keyed by (job_id, after_idx), so
+        # concurrent identical reads share one query.
+        self._segment_reads: Dict[tuple, asyncio.Future] = {}
+
+        # Progress updates are buffered per job and flushed in one
+        # transaction by a short-lived timer task.
+        self._pending_progress: Dict[str, float] = {}
+        self._progress_flush_task: Optional[asyncio.Task] = None
+
+        # The settings table is tiny and rarely written, so it is loaded
+        # once and served from memory.  set_setting updates it from the
+        # writer thread, hence the lock.
+        self._settings_lock = threading.RLock()
+        self._settings_cache: Dict[str, str] = dict(
+            self._read_inline("SELECT key, value FROM settings")
         )
-        self._reader_local = threading.local()
 
     # ------------------------------------------------------------------
     # Connection helpers
     # ------------------------------------------------------------------
 
     def _get_writer(self) -> sqlite3.Connection:
-        """Get or create the persistent writer connection."""
+        """Get or create the persistent writer connection.
+
+        Must only be called on the writer thread: the connection keeps
+        sqlite3's same-thread check enabled.
+        """
         if self._writer_conn is None:
-            self._writer_conn = self._make_connection()
+            self._writer_conn = sqlite3.connect(
+                str(self.db_path),
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            self._apply_pragmas(self._writer_conn)
         return self._writer_conn
 
-    def _get_reader(self) -> sqlite3.Connection:
-        """Get or create a per-thread reader connection."""
-        conn = getattr(self._reader_local, "conn", None)
-        if conn is None:
-            conn = self._make_connection()
-            self._reader_local.conn = conn
-        return conn
+    def _close_writer(self):
+        """Close the writer connection (runs on the writer thread)."""
+        if self._writer_conn is not None:
+            self._writer_conn.close()
+            self._writer_conn = None
 
-    def _make_connection(self) -> sqlite3.Connection:
-        """Create a new connection with standard pragmas."""
-        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")
+    def _get_loop_reader(self) -> sqlite3.Connection:
+        """Get or create the reader connection owned by the event loop thread."""
+        if self._loop_conn is None:
+            self._loop_conn = self._make_reader()
+        return self._loop_conn
+
+    def _make_reader(self) -> sqlite3.Connection:
+        """Create a read-only, autocommit reader connection.
+
+        ``mode=ro`` guarantees the connection can never write, and with
+        ``isolation_level=None`` a SELECT never opens an implicit
+        transaction.  Pooled readers hop between worker threads, so the
+        same-thread check is disabled.
+        """
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        self._apply_pragmas(conn)
         return conn
 
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection):
+        """Apply the standard connection pragmas."""
+        # journal_mode must come first: synchronous=NORMAL is only
+        # crash-safe once the connection is in WAL mode.
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
     # ------------------------------------------------------------------
     # Low-level execute helpers
     # ------------------------------------------------------------------
 
-    def _read(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
-        """Execute a read-only query on a reader connection."""
-        conn = self._get_reader()
+    @staticmethod
+    def _read(conn: sqlite3.Connection, query: str,
+              params: tuple = ()) -> List[tuple]:
+        """Execute a read-only query on the given reader connection."""
         cursor = conn.execute(query, params)
         return cursor.fetchall()
 
-    def _write(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+    @contextlib.asynccontextmanager
+    async def _checkout_reader(self):
+        """Borrow a pooled reader connection for the duration of the block."""
+        async with self._reader_slots:
+            if self._idle_readers:
+                conn = self._idle_readers.pop()
+            else:
+                conn = self._make_reader()
+            try:
+                yield conn
+            finally:
+                self._idle_readers.append(conn)
+
+    async def _run_read(self, fn, *args):
+        """Run ``fn(conn, *args)`` in a worker thread on a pooled reader."""
+        async with self._checkout_reader() as conn:
+            return await asyncio.to_thread(fn, conn, *args)
+
+    def _read_inline(self, query: str, params: tuple = ()) -> List[tuple]:
+        """Execute a small read-only query directly on the event loop thread.
+
+        Point lookups in WAL mode are answered from the page cache in
+        microseconds, well under the cost of an executor round trip.  Only
+        use this for queries with a small, bounded result set.
+        """
+        return self._get_loop_reader().execute(query, params).fetchall()
+
+    def _write(self, query: str, params: tuple = ()) -> List[tuple]:
         """Execute a write query on the writer connection and commit."""
         conn = self._get_writer()
         cursor = conn.execute(query, params)
         results = cursor.fetchall()
-        conn.commit()
+        self._commit(conn)
         return results
 
+    def _write_count(self, query: str, params: tuple = ()) -> int:
+        """Execute a write on the writer connection, commit, and return the
+        number of rows it touched."""
+        conn = self._get_writer()
+        cursor = conn.execute(query, params)
+        self._commit(conn)
+        return cursor.rowcount
+
     def _write_many(self, query: str, params_list: List[tuple]):
         """Execute many write queries in a single transaction."""
         conn = self._get_writer()
         conn.executemany(query, params_list)
-        conn.commit()
+        self._commit(conn)
+
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit unless the write belongs to an open transaction() block
+        or a group commit, which commit on their own."""
+        if self._tx_task is None and not self._in_group_commit:
+            conn.commit()
+
+    async def _submit_write(self, fn, *args):
+        """Run *fn* on the writer thread.
+
+        Writes are queued and applied in groups under a single commit, so
+        concurrent writers share one WAL fsync instead of paying one each.
+        Writes from tasks other than the owner of an open transaction wait
+        for it to finish, so they are never folded into (or rolled back
+        with) someone else's transaction.
+        """
+        loop = asyncio.get_running_loop()
+        if self._tx_task is not None and self._tx_task is asyncio.current_task():
+            return await loop.run_in_executor(self._write_executor, fn, *args)
+        self._check_not_spawned_in_transaction()
+
+        future = loop.create_future()
+        self._write_queue.append((fn, args, future))
+        if self._group_commit_task is None or self._group_commit_task.done():
+            self._group_commit_task = loop.create_task(self._group_commit())
+        return await future
+
+    async def _group_commit(self):
+        """Drain the write queue, one commit per group of writes."""
+        loop = asyncio.get_running_loop()
+        while self._write_queue:
+            # Let writers scheduled in the same loop iteration enqueue too;
+            # anything arriving while a group runs joins the next one.
+            await asyncio.sleep(0)
+            group = [
+                self._write_queue.popleft()
+                for _ in range(min(len(self._write_queue), _GROUP_COMMIT_MAX))
+            ]
+            async with self._tx_lock:
+                try:
+                    outcomes = await loop.run_in_executor(
+                        self._write_executor, self._run_group, group
+                    )
+                except Exception as e:
+                    outcomes = [(False, e)] * len(group)
+            for (_, _, future), (ok, value) in zip(group, outcomes):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _run_group(self, group: list) -> list:
+        """Apply a group of queued writes and commit once (writer thread).
+
+        A failing write only rolls back its own statement, so it is
+        reported to its caller without affecting the rest of the group.
+        """
+        outcomes = []
+        self._in_group_commit = True
+        try:
+            for fn, args, _ in group:
+                try:
+                    outcomes.append((True, fn(*args)))
+                except Exception as e:
+                    outcomes.append((False, e))
+        finally:
+            self._in_group_commit = False
+        conn = self._get_writer()
+        try:
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return outcomes
+
+    def _check_not_spawned_in_transaction(self):
+        """Refuse a write from a task started inside the open transaction.
+
+        Such a write would wait for the transaction to finish while the
+        owner, typically in ``asyncio.gather``, waits for the write.
+        """
+        if self._tx_token is not None and _TX_CONTEXT.get() is self._tx_token:
+            raise RuntimeError(
+                "database write from a task started inside transaction(); "
+                "await DAO writes directly in the task that opened it"
+            )
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """Group the current task's writes into a single transaction.
+
+        Writes issued inside ``async with db.transaction():`` are committed
+        together on exit -- one WAL commit instead of one per write -- or
+        rolled back if the block raises.  The transaction is opened lazily
+        by the first statement.  Nested blocks join the outer transaction.
+
+        Only the task that opened the block may write inside it.  Writes
+        from tasks it starts (``asyncio.gather``, ``create_task``) raise
+        RuntimeError while the block is open rather than deadlocking.
+        """
+        if self._tx_task is not None and self._tx_task is asyncio.current_task():
+            yield self
+            return
+        self._check_not_spawned_in_transaction()
+
+        loop = asyncio.get_running_loop()
+        async with self._tx_lock:
+            self._tx_task = asyncio.current_task()
+            self._tx_token = token = object()
+            reset = _TX_CONTEXT.set(token)
+            try:
+                yield self
+            except BaseException:
+                await loop.run_in_executor(
+                    self._write_executor, lambda: self._get_writer().rollback()
+                )
+                raise
+            else:
+                await loop.run_in_executor(
+                    self._write_executor, lambda: self._get_writer().commit()
+                )
+            finally:
+                _TX_CONTEXT.reset(reset)
+                self._tx_task = None
+                self._tx_token = None
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def close(self):
-        """Close all database connections and shut down executors."""
-        if self._writer_conn is not None:
-            self._writer_conn.close()
-            self._writer_conn = None
-        self._write_executor.shutdown(wait=False)
-        self._read_executor.shutdown(wait=False)
+        """Close all database connections and shut down executors.
+
+        Any buffered progress updates are written before the writer
+        connection is closed.
+        """
+        if self._progress_flush_task is not None:
+            self._progress_flush_task.cancel()
+            self._progress_flush_task = None
+        pending = self._drain_progress()
+        if pending:
+            self._write_executor.submit(self._write_many, *pending)
+        self._write_executor.submit(self._close_writer)
+        self._write_executor.shutdown(wait=True)
+        for conn in self._idle_readers:
+            conn.close()
+        self._idle_readers.clear()
+        if self._loop_conn is not None:
+            self._loop_conn.close()
+            self._loop_conn = None
 
     # ------------------------------------------------------------------
     # Jobs
     # ------------------------------------------------------------------
 
-    async def new_job_id(self) -> str:
-        """Generate a new job ID"""
-        return str(uuid.uuid4())
+    def new_job_id(self) -> str:
+        """Generate a new job ID (32 hex characters, no hyphens)"""
+        return uuid.uuid4().hex
 
-    async def create_job(self, job_id: str, audio_path: str, model: str = "base",
-                        language: str = "auto", translate: bool = False) -> bool:
+    @_writer
+    def create_job(self, job_id: str, audio_path: str, model: str = "base",
+                   language: str = "auto", translate: bool = False) -> bool:
         """Create a new transcription job"""
-        now = datetime.now(timezone.utc).isoformat()
+        now = _now_iso()
 
         query = """
         INSERT INTO jobs (job_id, status, audio_path, model, language,
@@ -134,112 +488,173 @@ class Database:
         params = (job_id, 1, audio_path, model, language,
                  int(translate), 0.0, now, now)  # Status 1 = QUEUED
 
-        def _create():
-            try:
-                self._write(query, params)
-                return True
-            except Exception as e:
-                logger.error(f"Failed to create job: {e}")
-                return False
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _create
-        )
+        try:
+            self._write(query, params)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create job: {e}")
+            return False
 
     async def update_job_status(self, job_id: str, status: int, error: Optional[str] = None) -> bool:
-        """Update job status"""
-        now = datetime.now(timezone.utc).isoformat()
+        """Update job status.
 
-        if error:
-            query = "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE job_id = ?"
-            params = (status, error, now, job_id)
-        else:
-            query = "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?"
-            params = (status, now, job_id)
+        Any buffered progress for the job is written in the same statement
+        so the row is never left with a stale progress value.
 
-        def _update():
-            try:
-                self._write(query, params)
-                return True
-            except Exception as e:
-                logger.error(f"Failed to update job status: {e}")
-                return False
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _update
+        Returns:
+            True if the job exists and was updated, False otherwise.
+        """
+        progress = self._pending_progress.pop(job_id, None)
+        return await self._write_job_status(job_id, status, error, progress)
+
+    @_writer
+    def _write_job_status(self, job_id: str, status: int,
+                          error: Optional[str], progress: Optional[float]) -> bool:
+        """Write a status change (and optional progress) to the jobs row."""
+        assignments = ["status = ?"]
+        params_list: List[Any] = [status]
+        if error:
+            assignments.append("error = ?")
+            params_list.append(error)
+        if progress is not None:
+            assignments.append("progress = ?")
+            params_list.append(progress)
+        query = (
+            f"UPDATE jobs SET {', '.join(assignments)}, updated_at = ? "
+            f"WHERE job_id = ?"
         )
+        params = (*params_list, _now_iso(), job_id)
+
+        try:
+            return self._write_count(query, params) > 0
+        except Exception as e:
+            logger.error(f"Failed to update job status: {e}")
+            return False
 
     async def update_job_progress(self, job_id: str, progress: float):
-        """Update job progress"""
-        now = datetime.now(timezone.utc).isoformat()
+        """Update job progress.
+
+        The value is buffered in memory and written at most every
+        ``_PROGRESS_FLUSH_INTERVAL`` seconds, or together with the next
+        ``update_job_status`` call for the same job.
+        """
+        if self._tx_task is not None and self._tx_task is asyncio.current_task():
+            # Inside a transaction the write rides along with its commit.
+            self._pending_progress.pop(job_id, None)
+            query = "UPDATE jobs SET progress = ?, updated_at = ? WHERE job_id = ?"
+            await self._submit_write(self._write, query, (progress, _now_iso(), job_id))
+            return
+
+        self._pending_progress[job_id] = progress
+        if self._progress_flush_task is None or self._progress_flush_task.done():
+            # Started in an empty context so a flush scheduled from inside
+            # a transaction block isn't mistaken for one of its writes.
+            self._progress_flush_task = contextvars.Context().run(
+                asyncio.create_task, self._flush_progress_later()
+            )
+
+    def _drain_progress(self) -> Optional[tuple]:
+        """Take all buffered progress values as ``_write_many`` arguments."""
+        if not self._pending_progress:
+            return None
+        pending, self._pending_progress = self._pending_progress, {}
+        now = _now_iso()
         query = "UPDATE jobs SET progress = ?, updated_at = ? WHERE job_id = ?"
+        return query, [
+            (progress, now, job_id) for job_id, progress in pending.items()
+        ]
 
-        def _update():
-            self._write(query, (progress, now, job_id))
-
-        await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _update
-        )
+    async def _flush_progress_later(self):
+        """Wait one flush interval, then write all buffered progress."""
+        await asyncio.sleep(_PROGRESS_FLUSH_INTERVAL)
+        pending = self._drain_progress()
+        if pending is None:
+            return
+        try:
+            await self._submit_write(self._write_many, *pending)
+        except Exception as e:
+            logger.error(f"Failed to flush job progress: {e}")
 
     async def list_jobs(self, limit: int = 100) -> List[Dict[str, Any]]:
         """List recent jobs"""
-        query = """
-        SELECT job_id, status, audio_path, model, language, translate,
-               progress, error, created_at, updated_at
-        FROM jobs
-        ORDER BY created_at DESC
-        LIMIT ?
-        """
+        query = f"{_JOB_SELECT} ORDER BY created_at DESC LIMIT ?"
 
-        def _list():
-            rows = self._read(query, (limit,))
-            return [dict(row) for row in rows]
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._read_executor, _list
-        )
+        rows = self._read_inline(query, (limit,))
+        return [dict(zip(_JOB_COLUMNS, row)) for row in rows]
 
     async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific job"""
-        query = """
-        SELECT job_id, status, audio_path, model, language, translate,
-               progress, error, created_at, updated_at
-        FROM jobs
-        WHERE job_id = ?
-        """
+        query = f"{_JOB_SELECT} WHERE job_id = ?"
 
-        def _get():
-            rows = self._read(query, (job_id,))
-            return dict(rows[0]) if rows else None
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._read_executor, _get
-        )
+        rows = self._read_inline(query, (job_id,))
+        job = dict(zip(_JOB_COLUMNS, rows[0])) if rows else None
+        # Overlay progress that has not been flushed yet.
+        if job is not None and job_id in self._pending_progress:
+            job['progress'] = self._pending_progress[job_id]
+        return job
 
     # ------------------------------------------------------------------
     # Segments
     # ------------------------------------------------------------------
 
     async def get_segments(self, job_id: str, after_idx: int = -1) -> List[Dict[str, Any]]:
-        """Get transcript segments for a job, optionally only those after a given index"""
-        query = """
-        SELECT idx, start, end, text, edited_text
-        FROM transcript_segments
-        WHERE job_id = ? AND idx > ?
-        ORDER BY idx
-        """
+        """Get transcript segments for a job, optionally only those after a given index
 
-        def _get():
-            rows = self._read(query, (job_id, after_idx))
-            return [dict(row) for row in rows]
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._read_executor, _get
-        )
-
-    async def insert_segments_batch(self, job_id: str, segments: List[Dict[str, Any]]):
+        Callers asking for the same segments while a read is in flight
+        share its result, so they must not mutate the returned list.
+        """
+        key = (job_id, after_idx)
+        pending = self._segment_reads.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        def _get(conn):
+            rows = self._read(conn, _SEGMENTS_QUERY, (job_id, after_idx))
+            return [dict(zip(_SEGMENT_COLUMNS, row)) for row in rows]
+
+        pending = self._segment_reads[key] = asyncio.ensure_future(self._run_read(_get))
+        pending.add_done_callback(functools.partial(self._forget_segment_read, key))
+        # Shielded: one caller being cancelled must not cancel the others.
+        return await asyncio.shield(pending)
+
+    def _forget_segment_read(self, key: tuple, future: asyncio.Future):
+        """Drop a finished read so later calls query the database again."""
+        if self._segment_reads.get(key) is future:
+            del self._segment_reads[key]
+
+    async def iter_segments(self, job_id: str, after_idx: int = -1,
+                            batch_size: int = _SEGMENT_BATCH_SIZE
+                            ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield a job's transcript segments in batches of up to *batch_size*.
+
+        Unlike ``get_segments`` this never materialises the whole
+        transcript, so memory stays flat and the first batch is available
+        immediately regardless of transcript length.
+
+        Each batch is its own keyset query (``idx > last``), and the reader
+        is returned to the pool before the batch is yielded: a slow consumer
+        never pins a reader slot or an open read snapshot, which would stop
+        WAL checkpoints.
+        """
+        def _page(conn, last_idx):
+            return self._read(
+                conn, _SEGMENTS_PAGE_QUERY, (job_id, last_idx, batch_size)
+            )
+
+        last_idx = after_idx
+        while True:
+            rows = await self._run_read(_page, last_idx)
+            if not rows:
+                return
+            yield [dict(zip(_SEGMENT_COLUMNS, row)) for row in rows]
+            if len(rows) < batch_size:
+                return
+            last_idx = rows[-1][0]
+
+    @_writer
+    def insert_segments_batch(self, job_id: str, segments: List[Dict[str, Any]]):
         """Insert multiple transcript segments in a single transaction"""
-        now = datetime.now(timezone.utc).isoformat()
+        now = _now_iso()
 
         query = """
         INSERT INTO transcript_segments (job_id, idx, start, end, text, created_at)
@@ -251,68 +666,168 @@ class Database:
             for seg in segments
         ]
 
-        def _insert():
-            self._write_many(query, params_list)
+        self._write_many(query, params_list)
 
-        await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _insert
-        )
+    @_writer
+    def copy_segments(self, source_job_id: str, job_id: str) -> int:
+        """Copy another job's transcript segments into a job.
 
-    async def save_segment_edits(self, job_id: str, edits: List[Dict[str, Any]]):
+        Only the transcribed text is copied; edits belong to the source job.
+        Returns the number of segments copied.
+        """
+        query = """
+        INSERT INTO transcript_segments (job_id, idx, start, end, text, created_at)
+        SELECT ?, idx, start, end, text, ?
+          FROM transcript_segments
+         WHERE job_id = ?
+         ORDER BY idx
+        """
+        return self._write_count(query, (job_id, _now_iso(), source_job_id))
+
+    @_writer
+    def save_segment_edits(self, job_id: str, edits: List[Dict[str, Any]]):
         """Save edited text for specific segments of a job.
 
         Each entry in *edits* must have 'segment_index' and 'edited_text'.
         An empty 'edited_text' clears a previous edit.
         """
-        query = """
-        UPDATE transcript_segments
-           SET edited_text = ?
-         WHERE job_id = ? AND idx = ?
-        """
-
-        params_list = [
-            (edit['edited_text'] or None, job_id, edit['segment_index'])
+        # Later edits to the same segment win, as they would if applied
+        # one by one.
+        latest = {
+            edit['segment_index']: edit['edited_text'] or None
             for edit in edits
-        ]
-
-        def _save():
+        }
+        if not latest:
+            return
+
+        if not _HAS_UPDATE_FROM:
+            query = """
+            UPDATE transcript_segments
+               SET edited_text = ?
+             WHERE job_id = ? AND idx = ?
+            """
+            params_list = [
+                (text, job_id, idx) for idx, text in latest.items()
+            ]
             self._write_many(query, params_list)
+            return
 
-        await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _save
-        )
+        # One statement per chunk, all committed together.
+        items = list(latest.items())
+        conn = self._get_writer()
+        for start in range(0, len(items), _EDIT_CHUNK_SIZE):
+            chunk = items[start:start + _EDIT_CHUNK_SIZE]
+            values = ", ".join(["(?, ?)"] * len(chunk))
+            query = f"""
+            WITH v(idx, new_text) AS (VALUES {values})
+            UPDATE transcript_segments
+               SET edited_text = v.new_text
+              FROM v
+             WHERE transcript_segments.job_id = ?
+               AND transcript_segments.idx = v.idx
+            """
+            params = [p for pair in chunk for p in pair]
+            params.append(job_id)
+            conn.execute(query, params)
+        self._commit(conn)
 
     # ------------------------------------------------------------------
     # Job lifecycle
     # ------------------------------------------------------------------
 
     async def delete_job(self, job_id: str) -> bool:
-        """Delete a job and its segments"""
-        query = "DELETE FROM jobs WHERE job_id = ?"
+        """Delete a job and its segments.
 
-        def _delete():
-            try:
-                self._write(query, (job_id,))
-                return True
-            except Exception as e:
-                logger.error(f"Failed to delete job: {e}")
-                return False
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _delete
+        Returns:
+            True if the job existed and was deleted, False otherwise.
+        """
+        self._pending_progress.pop(job_id, None)
+        return await self._delete_job_row(job_id)
+
+    @_writer
+    def _delete_job_row(self, job_id: str) -> bool:
+        """Delete the jobs row; segments go with it via ON DELETE CASCADE."""
+        try:
+            return self._write_count(
+                "DELETE FROM jobs WHERE job_id = ?", (job_id,)
+            ) > 0
+        except Exception as e:
+            logger.error(f"Failed to delete job: {e}")
+            return False
+
+    @_writer
+    def set_job_content_key(self, job_id: str, content_key: str):
+        """Record the content key a job's transcript can be reused under"""
+        self._write(
+            "UPDATE jobs SET content_key = ? WHERE job_id = ?",
+            (content_key, job_id),
         )
 
+    async def find_completed_job(self, content_key: str) -> Optional[str]:
+        """Return the newest completed job with this content key, if any"""
+        query = """
+        SELECT job_id FROM jobs
+         WHERE content_key = ? AND status = 3
+         ORDER BY created_at DESC
+         LIMIT 1
+        """  # 3 = COMPLETED
+        rows = self._read_inline(query, (content_key,))
+        return rows[0][0] if rows else None
+
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a job by setting its status to CANCELED"""
         return await self.update_job_status(job_id, 5)  # 5 = CANCELED
 
-    async def fail_stale_jobs(self) -> int:
+    async def cancel_job_if_active(self, job_id: str) -> bool:
+        """Cancel a job only if it is still QUEUED or RUNNING.
+
+        The status check and the update are one statement, so a job that
+        finishes concurrently is never flipped to CANCELED.  Buffered
+        progress is written in the same statement.
+
+        Returns:
+            True if the job was active and is now canceled, False otherwise.
+        """
+        progress = self._pending_progress.pop(job_id, None)
+        return await self._cancel_active_job(job_id, progress)
+
+    @_writer
+    def _cancel_active_job(self, job_id: str, progress: Optional[float]) -> bool:
+        """Conditionally mark a job CANCELED, writing any buffered progress."""
+        query = """
+        UPDATE jobs
+           SET status = 5, progress = COALESCE(?, progress), updated_at = ?
+         WHERE job_id = ? AND status IN (1, 2)
+        """  # 1=QUEUED, 2=RUNNING, 5=CANCELED
+        return self._write_count(query, (progress, _now_iso(), job_id)) > 0
+
+    async def complete_job_if_running(self, job_id: str) -> bool:
+        """Mark a job COMPLETED at full progress only if it is still RUNNING.
+
+        Returns:
+            True if the job was running and is now completed, False if it
+            was canceled, failed or deleted in the meantime.
+        """
+        self._pending_progress.pop(job_id, None)
+        return await self._complete_running_job(job_id)
+
+    @_writer
+    def _complete_running_job(self, job_id: str) -> bool:
+        """Conditionally mark a job COMPLETED."""
+        query = """
+        UPDATE jobs
+           SET status = 3, progress = 1.0, updated_at = ?
+         WHERE job_id = ? AND status = 2
+        """  # 2=RUNNING, 3=COMPLETED
+        return self._write_count(query, (_now_iso(), job_id)) > 0
+
+    @_writer
+    def fail_stale_jobs(self) -> int:
         """Mark any QUEUED or RUNNING jobs as FAILED.
 
         Called at startup to recover from a previous unclean shutdown.
         Returns the number of jobs that were updated.
         """
-        now = datetime.now(timezone.utc).isoformat()
         error = "Server restarted while job was in progress"
         query = """
         UPDATE jobs
@@ -320,54 +835,43 @@ class Database:
          WHERE status IN (1, 2)
         """  # 1=QUEUED, 2=RUNNING, 4=FAILED
 
-        def _recover():
-            conn = self._get_writer()
-            cursor = conn.execute(query, (error, now))
-            conn.commit()
-            return cursor.rowcount
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _recover
-        )
+        conn = self._get_writer()
+        cursor = conn.execute(query, (error, _now_iso()))
+        self._commit(conn)
+        return cursor.rowcount
 
     # ------------------------------------------------------------------
     # Settings
     # ------------------------------------------------------------------
 
-    async def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
-        """Get a setting value"""
-        query = "SELECT value FROM settings WHERE key = ?"
-
-        def _get():
-            rows = self._read(query, (key,))
-            return rows[0]['value'] if rows else default
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._read_executor, _get
-        )
+    def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a setting value (served from the in-memory cache)"""
+        with self._settings_lock:
+            return self._settings_cache.get(key, default)
 
-    async def set_setting(self, key: str, value: str):
+    @_writer
+    def set_setting(self, key: str, value: str):
         """Set a setting value"""
         query = """
         INSERT INTO settings (key, value) VALUES (?, ?)
         ON CONFLICT(key) DO UPDATE SET value = excluded.value
         """
 
-        def _set():
+        with self._settings_lock:
             self._write(query, (key, value))
-
-        await asyncio.get_running_loop().run_in_executor(
-            self._write_executor, _set
-        )
-
-    async def get_all_settings(self) -> Dict[str, str]:
-        """Get all settings"""
-        query = "SELECT key, value FROM settings"
-
-        def _get():
-            rows = self._read(query)
-            return {row['key']: row['value'] for row in rows}
-
-        return await asyncio.get_running_loop().run_in_executor(
-            self._read_executor, _get
-        )
+            self._settings_cache[key] = value
+
+    def get_bool_setting(self, key: str, default: bool) -> bool:
+        """Get a boolean setting (stored as 'true'/'false')"""
+        with self._settings_lock:
+            value = self._settings_cache.get(key)
+        return default if value is None else value.lower() == 'true'
+
+    def get_all_settings(self) -> Dict[str, str]:
+        """Get all settings (served from the in-memory cache)"""
+        with self._settings_lock:
+            return dict(self._settings_cache)
+
+    async def ping(self) -> bool:
+        """Run a trivial query to confirm the database is reachable."""
+        return self._read_inline("SELECT 1") == [(1,)]
@@ -1,12 +1,21 @@
 """Database initialization module"""
 
+import contextlib
 import os
 import sqlite3
+import sys
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever schema.sql or the migrations below change.  Stored in the
+# database's ``PRAGMA user_version`` so up-to-date files skip schema work.
+SCHEMA_VERSION = 4
+
+# Database paths already initialized by this process.
+_initialized_paths: set = set()
+
 
 def get_db_path() -> Path:
     """Get the database file path"""
@@ -24,23 +33,58 @@ def get_db_path() -> Path:
     return data_dir / 'scribe.db'
 
 
-def init_database():
-    """Initialize the database with schema"""
-    db_path = get_db_path()
+@contextlib.contextmanager
+def _init_lock(db_path: Path):
+    """Hold an exclusive cross-process lock on a sidecar file.
+
+    Serialises schema setup between processes starting against the same
+    database, so two first-time starts can't both run the migrations.
+    """
+    lock_path = db_path.with_name(db_path.name + '.init.lock')
+    with open(lock_path, 'a+b') as lock_file:
+        if sys.platform == 'win32':
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _schema_version(db_path: Path) -> int:
+    """Read the database's ``PRAGMA user_version``."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _apply_schema(db_path: Path):
+    """Run schema.sql and migrations, then stamp ``SCHEMA_VERSION``."""
     schema_path = Path(__file__).parent / 'schema.sql'
-    
+
     logger.info(f"Initializing database at: {db_path}")
-    
+
     # Create connection
     conn = sqlite3.connect(str(db_path))
-    
+
     try:
         # Read and execute schema
         with open(schema_path, 'r') as f:
             schema = f.read()
-        
+
         conn.executescript(schema)
-        
+
         # Migrate: add edited_text column if missing
         cursor = conn.execute("PRAGMA table_info(transcript_segments)")
         columns = {row[1] for row in cursor.fetchall()}
@@ -51,12 +95,26 @@ def init_database():
             conn.commit()
             logger.info("Migrated: added edited_text column")
 
+        # Migrate: add content_key column (and its index) if missing
+        cursor = conn.execute("PRAGMA table_info(jobs)")
+        if 'content_key' not in {row[1] for row in cursor.fetchall()}:
+            conn.execute("ALTER TABLE jobs ADD COLUMN content_key TEXT")
+            logger.info("Migrated: added content_key column")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_content_key "
+            "ON jobs(content_key, status, created_at)"
+        )
+
+        # Migrate: the covering index supersedes the (job_id, idx) index
+        conn.execute("DROP INDEX IF EXISTS idx_segments_job_id_idx")
+
         # Enable WAL mode for better concurrency
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        
+
         logger.info("Database initialized successfully")
-        
+
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
@@ -64,6 +122,26 @@ def init_database():
         conn.close()
 
 
+def init_database():
+    """Initialize the database with schema.
+
+    Cheap to call repeatedly: a path is only checked once per process, and
+    a database whose ``user_version`` already matches ``SCHEMA_VERSION`` is
+    left untouched without reading schema.sql or taking the init lock.
+    """
+    db_path = get_db_path()
+    if db_path in _initialized_paths:
+        return
+
+    if _schema_version(db_path) != SCHEMA_VERSION:
+        with _init_lock(db_path):
+            # Another process may have finished while we waited.
+            if _schema_version(db_path) != SCHEMA_VERSION:
+                _apply_schema(db_path)
+
+    _initialized_paths.add(db_path)
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     init_database()
\ No newline at end of file
@@ -11,10 +11,17 @@ CREATE TABLE IF NOT EXISTS jobs (
     translate INTEGER DEFAULT 0,
     progress REAL DEFAULT 0.0,
     error TEXT,
+    -- Hash of the audio content and transcription options; a completed
+    -- job's segments are reused by later jobs with the same key.
+    content_key TEXT,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL
 );
 
+-- ListJobs reads the newest jobs first; walking this index backwards
+-- answers ORDER BY created_at DESC LIMIT n without sorting the table.
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at);
+
 -- Settings table for key-value configuration
 CREATE TABLE IF NOT EXISTS settings (
     key TEXT PRIMARY KEY,
@@ -34,6 +41,7 @@ CREATE TABLE IF NOT EXISTS transcript_segments (
     FOREIGN KEY(job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
 );
 
--- Index for efficient segment queries
-CREATE INDEX IF NOT EXISTS idx_segments_job_id_idx 
-ON transcript_segments(job_id, idx);
\ No newline at end of file
+-- Covering index for segment queries: get_segments is answered from the
+-- index b-tree alone, without a rowid lookup per segment.
+CREATE INDEX IF NOT EXISTS idx_segments_cover
+ON transcript_segments(job_id, idx, start, end, text, edited_text);
\ No newline at end of file
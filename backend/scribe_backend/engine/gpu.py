@@ -1,10 +1,21 @@
 """GPU detection and capability checking"""
 
+import ctypes
+import functools
+import json
 import logging
+import os
+import socket
 import subprocess
+import sys
 import platform
 import importlib
-from typing import Optional
+import importlib.util
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +23,38 @@ logger = logging.getLogger(__name__)
 # Stores the detected GPU type: "nvidia", "apple_silicon", "amd", "directml", or None.
 _gpu_type: Optional[str] = None
 _gpu_type_checked: bool = False
+# Held while probing so concurrent first callers wait for one probe run.
+_gpu_lock = threading.Lock()
+
+# Probe results persisted across processes, keyed on host and kernel release.
+_GPU_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "scribe" / "gpu.json"
+)
+
+# NVML shared library names to try, per platform.
+_NVML_LIBRARIES = {
+    "Windows": (
+        "nvml.dll",
+        r"C:\Program Files\NVIDIA Corporation\NVSMI\nvml.dll",
+    ),
+    "Darwin": ("libnvidia-ml.dylib",),
+}.get(platform.system(), ("libnvidia-ml.so.1", "libnvidia-ml.so"))
+
+# CUDA libraries CTranslate2 loads at inference time (it links the CUDA
+# runtime statically), plus the pip wheel that ships each one.
+_CUDA_LIBRARIES = {
+    "Windows": (("cublas64_12.dll", "nvidia.cublas"), ("cudnn64_9.dll", "nvidia.cudnn")),
+    "Linux": (("libcublas.so.12", "nvidia.cublas"), ("libcudnn.so.9", "nvidia.cudnn")),
+}.get(platform.system(), ())
+
+# Handles of the preloaded CUDA libraries, kept alive for the process.
+_cuda_handles: List[ctypes.CDLL] = []
+
+# CPU brand string of an Apple Silicon Mac ("Apple M1 Pro", "Apple M3", ...).
+_APPLE_SILICON_RE = re.compile(r"apple m[1-9]", re.IGNORECASE)
+
+# Loaded NVML handle (None until the first successful load).
+_nvml_lib: Optional[ctypes.CDLL] = None
 
 
 def detect_gpu() -> bool:
@@ -23,6 +66,19 @@ def detect_gpu() -> bool:
     return detect_gpu_type() is not None
 
 
+def cpu_only_requested() -> bool:
+    """True if the environment asks for CPU-only inference.
+
+    Honors ``SCRIBE_FORCE_CPU=1``, ``CT2_FORCE_CPU=1`` and an explicitly
+    empty ``CUDA_VISIBLE_DEVICES``.
+    """
+    return (
+        os.environ.get("CUDA_VISIBLE_DEVICES") == ""
+        or os.environ.get("SCRIBE_FORCE_CPU") == "1"
+        or os.environ.get("CT2_FORCE_CPU") == "1"
+    )
+
+
 def detect_gpu_type() -> Optional[str]:
     """
     Detect the type of GPU acceleration available.
@@ -33,41 +89,229 @@ def detect_gpu_type() -> Optional[str]:
     if _gpu_type_checked:
         return _gpu_type
 
-    _gpu_type_checked = True
+    with _gpu_lock:
+        if not _gpu_type_checked:
+            _gpu_type = _resolve_gpu_type()
+            _gpu_type_checked = True
+    return _gpu_type
+
+
+def _resolve_gpu_type() -> Optional[str]:
+    """Return the persisted probe result for this host, probing on a miss."""
+    if cpu_only_requested():
+        logger.info("CPU-only mode requested by environment, skipping GPU probes")
+        return None
+
+    key = {"host": socket.gethostname(), "kernel": platform.release()}
+    hit, gpu_type = _read_gpu_cache(key)
+    # The probe also preloads cuBLAS/cuDNN for CTranslate2, so a cached
+    # "nvidia" still has to load them; if that fails, probe afresh.
+    # Entries written before negative results stopped being cached may
+    # hold None; those are re-probed too.
+    if hit and gpu_type is not None and (
+        gpu_type != "nvidia" or _load_cuda_libraries()
+    ):
+        logger.info(f"Using cached GPU detection result: {gpu_type}")
+        return gpu_type
+
+    gpu_type = _probe_gpu_type()
+    # Only positive results are remembered: a host without usable GPU
+    # support may gain it (driver, cuDNN install) without a kernel change.
+    if gpu_type is not None:
+        _write_gpu_cache(key, gpu_type)
+    return gpu_type
+
+
+def _read_gpu_cache(key: dict) -> Tuple[bool, Optional[str]]:
+    """Return (hit, gpu_type) from the on-disk cache."""
+    try:
+        with open(_GPU_CACHE_FILE, encoding="utf-8") as f:
+            entry = json.load(f)
+        if all(entry.get(k) == v for k, v in key.items()):
+            return True, entry.get("gpu_type")
+    except (OSError, ValueError, AttributeError):
+        pass
+    return False, None
+
+
+def _write_gpu_cache(key: dict, gpu_type: Optional[str]):
+    """Atomically persist a probe result; failures only cost a re-probe."""
+    try:
+        _GPU_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=_GPU_CACHE_FILE.parent, suffix=".tmp",
+            encoding="utf-8", delete=False,
+        ) as f:
+            json.dump({**key, "gpu_type": gpu_type}, f)
+        os.replace(f.name, _GPU_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write GPU cache {_GPU_CACHE_FILE}: {e}")
+
+
+def _probe_gpu_type() -> Optional[str]:
+    """Run the GPU probes in priority order; see detect_gpu_type()."""
     system = platform.system()
 
     # Try NVIDIA GPU first (cross-platform)
     if check_nvidia_gpu():
         logger.info("NVIDIA GPU detected")
-        _gpu_type = "nvidia"
-        return _gpu_type
+        return "nvidia"
 
     # Check for Apple Silicon on macOS
     if system == "Darwin" and check_apple_silicon():
         logger.info("Apple Silicon detected")
-        _gpu_type = "apple_silicon"
-        return _gpu_type
+        return "apple_silicon"
 
     # Check for AMD GPU on Linux
     if system == "Linux" and check_amd_gpu():
         logger.info("AMD GPU detected")
-        _gpu_type = "amd"
-        return _gpu_type
+        return "amd"
 
     # Check for DirectML on Windows
     if system == "Windows" and check_directml():
         logger.info("DirectML support detected")
-        _gpu_type = "directml"
-        return _gpu_type
+        return "directml"
 
     logger.info("No GPU acceleration available, will use CPU")
-    return _gpu_type
+    return None
+
+
+def _load_nvml() -> Optional[ctypes.CDLL]:
+    """Load the NVML library, or return None if the driver isn't installed."""
+    global _nvml_lib
+    if _nvml_lib is None:
+        for name in _NVML_LIBRARIES:
+            try:
+                _nvml_lib = ctypes.CDLL(name, mode=getattr(ctypes, "RTLD_GLOBAL", 0))
+                break
+            except OSError:
+                continue
+    return _nvml_lib
+
+
+def _nvml_device_count() -> Optional[int]:
+    """Count NVIDIA devices through NVML.
+
+    Returns None when NVML is unavailable, so callers can fall back to
+    other probes.  Much cheaper than forking nvidia-smi.
+    """
+    nvml = _load_nvml()
+    if nvml is None:
+        return None
+    try:
+        if nvml.nvmlInit_v2() != 0:  # NVML_SUCCESS == 0
+            return 0
+        try:
+            count = ctypes.c_uint(0)
+            if nvml.nvmlDeviceGetCount_v2(ctypes.byref(count)) != 0:
+                return 0
+            return count.value
+        finally:
+            nvml.nvmlShutdown()
+    except AttributeError:
+        # Very old driver without the _v2 entry points
+        return None
+
+
+class _NvmlMemory(ctypes.Structure):
+    _fields_ = [
+        ("total", ctypes.c_ulonglong),
+        ("free", ctypes.c_ulonglong),
+        ("used", ctypes.c_ulonglong),
+    ]
 
 
-def check_nvidia_gpu() -> bool:
-    """Check for NVIDIA GPU with CUDA support"""
+def get_free_gpu_memory(index: int = 0) -> Optional[int]:
+    """Free memory on an NVIDIA GPU in bytes, or None if NVML can't tell."""
+    nvml = _load_nvml()
+    if nvml is None:
+        return None
     try:
-        # Try to run nvidia-smi
+        if nvml.nvmlInit_v2() != 0:
+            return None
+        try:
+            handle = ctypes.c_void_p()
+            if nvml.nvmlDeviceGetHandleByIndex_v2(index, ctypes.byref(handle)) != 0:
+                return None
+            memory = _NvmlMemory()
+            if nvml.nvmlDeviceGetMemoryInfo(handle, ctypes.byref(memory)) != 0:
+                return None
+            return memory.free
+        finally:
+            nvml.nvmlShutdown()
+    except AttributeError:
+        return None
+
+
+def _load_cuda_library(name: str, package: str) -> Optional[ctypes.CDLL]:
+    """Load a CUDA library by soname, then from its pip wheel's lib dir."""
+    mode = getattr(ctypes, "RTLD_GLOBAL", 0)
+    try:
+        return ctypes.CDLL(name, mode=mode)
+    except OSError:
+        pass
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    subdir = "bin" if platform.system() == "Windows" else "lib"
+    for location in spec.submodule_search_locations:
+        try:
+            return ctypes.CDLL(os.path.join(location, subdir, name), mode=mode)
+        except OSError:
+            continue
+    return None
+
+
+def _load_cuda_libraries() -> bool:
+    """Check that cuBLAS and cuDNN are loadable, preloading them globally.
+
+    A driver without these libraries passes the device probe but fails as
+    soon as CTranslate2 runs on the GPU.  Loading them with RTLD_GLOBAL
+    also lets CTranslate2 find wheel-installed copies when
+    LD_LIBRARY_PATH doesn't point at them.
+    """
+    for name, package in _CUDA_LIBRARIES:
+        handle = _load_cuda_library(name, package)
+        if handle is None:
+            logger.warning(f"NVIDIA GPU found but {name} could not be loaded, using CPU")
+            return False
+        _cuda_handles.append(handle)
+    return True
+
+
+@functools.lru_cache(maxsize=2)
+def check_nvidia_gpu(validate_with_torch: bool = False) -> bool:
+    """Check for an NVIDIA GPU plus the CUDA libraries needed to use it.
+
+    torch is never needed for detection; pass ``validate_with_torch=True``
+    to additionally ask ``torch.cuda.is_available()`` (a multi-second
+    import) when it is installed.
+    """
+    if not (_has_nvidia_device() and _load_cuda_libraries()):
+        return False
+    if validate_with_torch:
+        try:
+            torch = importlib.import_module("torch")
+        except ImportError:
+            return True
+        if not torch.cuda.is_available():
+            logger.warning("NVIDIA GPU found but torch reports CUDA unavailable")
+            return False
+    return True
+
+
+def _has_nvidia_device() -> bool:
+    """Check for an NVIDIA device via NVML, falling back to nvidia-smi"""
+    count = _nvml_device_count()
+    if count is not None:
+        logger.debug(f"NVML reports {count} NVIDIA device(s)")
+        return count > 0
+
+    try:
+        # NVML unavailable; assume CUDA will work if nvidia-smi works
         result = subprocess.run(
             ['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'],
             capture_output=True,
@@ -76,26 +320,27 @@ def check_nvidia_gpu() -> bool:
         )
         if result.returncode == 0:
             logger.debug(f"NVIDIA GPU found: {result.stdout.strip()}")
-            # Try to import and check CUDA availability
-            try:
-                # Torch is optional; import lazily to avoid static import errors
-                torch = importlib.import_module("torch")
-                if torch.cuda.is_available():
-                    logger.debug(f"CUDA is available with {torch.cuda.device_count()} device(s)")
-                    return True
-            except ImportError:
-                # Torch not installed yet, assume CUDA will work if nvidia-smi works
-                return True
-                return True
-                
+            return True
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         pass
-    
+
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_apple_silicon() -> bool:
     """Check for Apple Silicon (M1/M2/M3) on macOS"""
+    # mac_ver() reports an empty release off macOS; on Apple Silicon the
+    # machine type is arm64 (Intel Macs, and x86_64 Python under Rosetta,
+    # report x86_64).  No subprocess needed.
+    release, _, machine = platform.mac_ver()
+    if not release:
+        return False
+    if (machine or platform.machine()) == "arm64":
+        logger.debug(f"Apple Silicon detected: macOS {release} arm64")
+        return True
+
+    # x86_64 Python running under Rosetta still reports the real CPU brand.
     try:
         result = subprocess.run(
             ['sysctl', '-n', 'machdep.cpu.brand_string'],
@@ -103,45 +348,45 @@ def check_apple_silicon() -> bool:
             text=True,
             timeout=5
         )
-        if result.returncode == 0:
-            cpu_brand = result.stdout.strip().lower()
-            if 'apple' in cpu_brand and any(f'm{i}' in cpu_brand for i in range(1, 10)):
-                logger.debug(f"Apple Silicon detected: {result.stdout.strip()}")
-                return True
+        if _APPLE_SILICON_RE.search(result.stdout):
+            logger.debug(f"Apple Silicon detected under Rosetta: {result.stdout.strip()}")
+            return True
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         pass
-    
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_amd_gpu() -> bool:
     """Check for AMD GPU with ROCm support on Linux"""
-    try:
-        # Check for ROCm installation
-        result = subprocess.run(
-            ['rocm-smi', '--showid'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            logger.debug("AMD GPU with ROCm detected")
-            return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    
+    # The ROCm compute interface (/dev/kfd) only exists when the amdgpu
+    # kernel driver is loaded; two stat calls instead of spawning rocm-smi.
+    if os.path.exists("/dev/kfd") and os.path.isdir("/sys/module/amdgpu"):
+        logger.debug("AMD GPU with ROCm detected")
+        return True
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_directml() -> bool:
     """Check for DirectML support on Windows"""
+    if platform.system() != "Windows":
+        return False
     try:
         # Check Windows version (needs Windows 10 1903+)
-        # platform.version() returns a string like "10.0.19045" on Windows.
-        version = platform.version()
-        parts = version.split(".")
-        build = int(parts[2]) if len(parts) >= 3 else 0
-        if build >= 18362:
+        if sys.getwindowsversion().build < 18362:
+            return False
+    except AttributeError:
+        return False
+
+    # A recent enough Windows build is necessary but not sufficient; ask
+    # the DirectML runtime whether it actually has a usable adapter.
+    try:
+        torch_directml = importlib.import_module("torch_directml")
+    except ImportError:
+        return False
+    try:
+        if torch_directml.device_count() > 0:
             logger.debug("DirectML support available on Windows")
             return True
     except Exception:
@@ -158,19 +403,17 @@ def get_compute_type(prefer_gpu: bool = True) -> str:
         str: Compute type string for faster-whisper
              Options: "int8", "float16", "float32", "int8_float16", "int8_float32"
     """
-    if not prefer_gpu:
+    if not prefer_gpu or cpu_only_requested():
         return "int8"
 
     gpu_type = detect_gpu_type()
     if gpu_type == "nvidia":
-        return "float16"
-    elif gpu_type == "apple_silicon":
-        # CTranslate2 on Apple Silicon runs on CPU; int8 is fastest
-        return "int8"
-    elif gpu_type in ("amd", "directml"):
-        return "float16"
-    else:
-        return "int8"
+        # int8 weights with float16 activations: roughly half the memory
+        # traffic of float16 at about the same accuracy
+        return "int8_float16"
+    # Apple Silicon, AMD ROCm and DirectML all run CTranslate2 on the CPU
+    # (see get_device), where int8 is fastest
+    return "int8"
 
 
 def get_device() -> str:
@@ -180,6 +423,8 @@ def get_device() -> str:
     Returns:
         str: Device string for CTranslate2/faster-whisper ("cuda", "cpu", or "auto")
     """
+    if cpu_only_requested():
+        return "cpu"
     gpu_type = detect_gpu_type()
     if gpu_type == "nvidia":
         return "cuda"
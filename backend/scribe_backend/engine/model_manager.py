@@ -1,32 +1,48 @@
 """Model management for Whisper models"""
 
+import fnmatch
+import functools
+import hashlib
 import os
 import logging
+import re
+import shutil
 import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, FrozenSet, Mapping, Tuple
 
-import huggingface_hub
-import requests
-from tqdm.auto import tqdm
+# huggingface_hub and tqdm are imported lazily inside the download paths;
+# listing, inspecting and deleting models never pays their import cost.
 
 logger = logging.getLogger(__name__)
 
-# Map short model names to HuggingFace repo IDs (mirrors faster_whisper.utils._MODELS)
-_MODEL_REPOS = {
-    "tiny.en": "Systran/faster-whisper-tiny.en",
-    "tiny": "Systran/faster-whisper-tiny",
-    "base.en": "Systran/faster-whisper-base.en",
-    "base": "Systran/faster-whisper-base",
-    "small.en": "Systran/faster-whisper-small.en",
-    "small": "Systran/faster-whisper-small",
-    "medium.en": "Systran/faster-whisper-medium.en",
-    "medium": "Systran/faster-whisper-medium",
-    "large-v1": "Systran/faster-whisper-large-v1",
-    "large-v2": "Systran/faster-whisper-large-v2",
-    "large-v3": "Systran/faster-whisper-large-v3",
-    "large": "Systran/faster-whisper-large-v3",
-}
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelSpec:
+    size: int  # approximate download size in bytes
+    repo: str  # HuggingFace repo ID
+
+
+# Available Whisper models (repo IDs mirror faster_whisper.utils._MODELS)
+_MODELS: Mapping[str, _ModelSpec] = MappingProxyType({
+    "tiny": _ModelSpec(39_000_000, "Systran/faster-whisper-tiny"),          # ~39 MB
+    "tiny.en": _ModelSpec(39_000_000, "Systran/faster-whisper-tiny.en"),    # ~39 MB
+    "base": _ModelSpec(74_000_000, "Systran/faster-whisper-base"),          # ~74 MB
+    "base.en": _ModelSpec(74_000_000, "Systran/faster-whisper-base.en"),    # ~74 MB
+    "small": _ModelSpec(244_000_000, "Systran/faster-whisper-small"),       # ~244 MB
+    "small.en": _ModelSpec(244_000_000, "Systran/faster-whisper-small.en"), # ~244 MB
+    "medium": _ModelSpec(769_000_000, "Systran/faster-whisper-medium"),     # ~769 MB
+    "medium.en": _ModelSpec(769_000_000, "Systran/faster-whisper-medium.en"),  # ~769 MB
+    "large-v1": _ModelSpec(1_550_000_000, "Systran/faster-whisper-large-v1"),  # ~1.5 GB
+    "large-v2": _ModelSpec(1_550_000_000, "Systran/faster-whisper-large-v2"),  # ~1.5 GB
+    "large-v3": _ModelSpec(1_550_000_000, "Systran/faster-whisper-large-v3"),  # ~1.5 GB
+    "large": _ModelSpec(1_550_000_000, "Systran/faster-whisper-large-v3"),     # ~1.5 GB (alias for large-v3)
+})
 
 _ALLOW_PATTERNS = [
     "config.json",
@@ -36,45 +52,256 @@ _ALLOW_PATTERNS = [
     "vocabulary.*",
 ]
 
+# _ALLOW_PATTERNS as one compiled regex, for filtering repo file listings.
+_ALLOW_RE = re.compile("|".join(fnmatch.translate(p) for p in _ALLOW_PATTERNS))
+
+# Number of repo files fetched concurrently by download_model_with_progress.
+_DOWNLOAD_WORKERS = 4
+
+# Seconds to wait for a file's metadata HEAD before falling back to what is
+# already on disk (huggingface_hub defaults to 10).
+_ETAG_TIMEOUT = 3
+
+# Attempts per file on connection errors; the backoff doubles from the min
+# delay up to the max.  Each retry resumes from the bytes already on disk.
+_DOWNLOAD_ATTEMPTS = 5
+_RETRY_MIN_DELAY = 4.0
+_RETRY_MAX_DELAY = 30.0
+
+# Weights file whose presence marks a model directory as usable.
+_MODEL_WEIGHTS = "model.bin"
+
+# Marker file present in a model directory while its download is unfinished.
+# Interrupted downloads keep their partial files (huggingface_hub resumes
+# them with HTTP Range requests); the marker keeps them from being reported
+# as downloaded.
+_INCOMPLETE_MARKER = ".scribe-incomplete"
+
+# sha256sum-format record of the files in a completed download.
+_CHECKSUM_SIDECAR = ".sha256"
+
+
+# Glob for directories renamed by _remove_tree and not yet deleted.
+_TOMBSTONE_GLOB = ".*.deleting-*"
+
+
+def _remove_tree(path: Path):
+    """Remove *path* without making the caller wait for the unlinks.
+
+    The directory is first renamed to a hidden sibling, which is atomic and
+    immediately makes the model look absent; the tree itself is deleted on
+    a daemon thread. Falls back to a synchronous rmtree if the rename fails.
+    A deletion cut short by exit is finished by the next ModelManager.
+    """
+    tombstone = path.with_name(f".{path.name}.deleting-{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(path, tombstone)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    _delete_in_background(tombstone)
+
+
+def _delete_in_background(tombstone: Path):
+    """Delete an already-renamed tree on a daemon thread."""
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(tombstone,),
+        kwargs={"ignore_errors": True},
+        name="model-delete",
+        daemon=True,
+    ).start()
+
 
 class DownloadCanceled(Exception):
     """Raised when a model download is canceled by the user."""
 
 
-class _ProgressTqdm(tqdm):
-    """Custom tqdm that reports byte-level progress via a callback and supports cancellation."""
+class DownloadCorrupted(Exception):
+    """Raised when a downloaded file does not match its published SHA256."""
+
+
+# Read size for the pre-3.11 hashing fallback.
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _file_digest(f, digest):
+    """Hash a binary file object; digest is a hashlib name or constructor.
+
+    Uses hashlib's native file_digest loop where available (3.11+) and a
+    chunked read loop on older interpreters.
+    """
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, digest)
+    h = hashlib.new(digest) if isinstance(digest, str) else digest()
+    buf = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            return h
+        h.update(view[:n])
+
+
+def _sha256_file(path: str) -> str:
+    """Hash a file's contents with SHA256."""
+    with open(path, "rb") as f:
+        return _file_digest(f, "sha256").hexdigest()
+
 
-    def __init__(self, *args, progress_callback=None, cancel_event=None, **kwargs):
+@functools.lru_cache(maxsize=None)
+def _hub():
+    """Import huggingface_hub, enabling hf_transfer when it is installed.
+
+    hf_transfer fetches each file over parallel range requests.  It is
+    only switched on if the package imports and the user hasn't set
+    HF_HUB_ENABLE_HF_TRANSFER themselves.
+    """
+    import huggingface_hub
+    from huggingface_hub import constants
+
+    if "HF_HUB_ENABLE_HF_TRANSFER" not in os.environ:
+        try:
+            import hf_transfer  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            constants.HF_HUB_ENABLE_HF_TRANSFER = True
+            logger.info("Using hf_transfer for model downloads")
+    return huggingface_hub
+
+
+@functools.lru_cache(maxsize=None)
+def _retryable_errors() -> Tuple[type, ...]:
+    """Transient network errors raised by the hub's HTTP client."""
+    errors: List[type] = []
+    try:
+        import requests
+        errors += [requests.exceptions.ConnectionError, requests.exceptions.Timeout]
+    except ImportError:
+        pass
+    try:
+        import httpx
+        errors.append(httpx.TransportError)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+class _DownloadAggregator:
+    """Sums byte progress across the per-file bars of one model download.
+
+    The progress callback runs on a dedicated reporter thread, so a slow
+    consumer never stalls the download threads; updates that arrive while
+    it is busy are coalesced into the latest totals.
+    """
+
+    def __init__(
+        self,
+        progress_callback: Callable[[int, int], None],
+        cancel_event: threading.Event,
+    ):
         self._progress_callback = progress_callback
         self._cancel_event = cancel_event
-        super().__init__(*args, **kwargs)
-
-    def update(self, n=1):
-        if self._cancel_event and self._cancel_event.is_set():
+        self._lock = threading.Lock()
+        # Per-file bytes already counted and file size.  Keyed by file so
+        # a retry's new bar replaces, rather than adds to, the old one.
+        self._seen: Dict[Any, int] = {}
+        self._totals: Dict[Any, int] = {}
+        self._downloaded = 0
+        self._total = 0
+        self._pending: Optional[Tuple[int, int]] = None
+        self._closed = False
+        self._wakeup = threading.Condition(self._lock)
+        self._reporter = threading.Thread(
+            target=self._deliver, name="model-download-progress", daemon=True
+        )
+        self._reporter.start()
+
+    def _deliver(self):
+        while True:
+            with self._lock:
+                while self._pending is None and not self._closed:
+                    self._wakeup.wait()
+                pending, self._pending = self._pending, None
+            if pending is None:
+                return
+            try:
+                self._progress_callback(*pending)
+            except Exception:
+                logger.exception("Download progress callback failed")
+
+    def close(self):
+        """Deliver the last pending update and stop the reporter thread."""
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        self._reporter.join()
+
+    def check_canceled(self):
+        if self._cancel_event.is_set():
             raise DownloadCanceled("Download canceled by user")
-        super().update(n)
-        if self._progress_callback and self.total:
-            self._progress_callback(self.n, self.total)
+
+    def register(self, key, bar):
+        """Record a newly created bar's total (and any resumed bytes)."""
+        with self._lock:
+            size = bar.total or 0
+            self._total += size - self._totals.get(key, 0)
+            self._totals[key] = size
+            self._downloaded += bar.n - self._seen.get(key, 0)
+            self._seen[key] = bar.n
+
+    def report(self, key, bar):
+        """Fold *bar*'s current count into the total and notify."""
+        with self._lock:
+            self._downloaded += bar.n - self._seen.get(key, 0)
+            self._seen[key] = bar.n
+            self._pending = (self._downloaded, self._total)
+            self._wakeup.notify()
+
+
+@functools.lru_cache(maxsize=None)
+def _aggregating_tqdm_class():
+    """Build the progress-reporting tqdm subclass on first use.
+
+    Defined lazily so that importing this module does not import tqdm.
+    """
+    from tqdm.auto import tqdm
+
+    class _AggregatingTqdm(tqdm):
+        """tqdm that forwards byte counts to a _DownloadAggregator and supports cancellation."""
+
+        def __init__(
+            self,
+            *args,
+            aggregator: Optional[_DownloadAggregator] = None,
+            key: Any = None,
+            **kwargs,
+        ):
+            self._aggregator = aggregator
+            self._aggregator_key = key if key is not None else id(self)
+            super().__init__(*args, **kwargs)
+            if aggregator is not None:
+                aggregator.register(self._aggregator_key, self)
+
+        def update(self, n=1):
+            aggregator = self._aggregator
+            if aggregator is not None:
+                aggregator.check_canceled()
+            super().update(n)
+            if aggregator is not None:
+                aggregator.report(self._aggregator_key, self)
+
+    return _AggregatingTqdm
 
 
 class ModelManager:
     """Manages Whisper model downloads and caching"""
     
-    # Available Whisper models with their approximate sizes in bytes
-    AVAILABLE_MODELS = {
-        "tiny": 39_000_000,      # ~39 MB
-        "tiny.en": 39_000_000,   # ~39 MB
-        "base": 74_000_000,      # ~74 MB
-        "base.en": 74_000_000,   # ~74 MB
-        "small": 244_000_000,    # ~244 MB
-        "small.en": 244_000_000, # ~244 MB
-        "medium": 769_000_000,   # ~769 MB
-        "medium.en": 769_000_000,# ~769 MB
-        "large-v1": 1_550_000_000,  # ~1.5 GB
-        "large-v2": 1_550_000_000,  # ~1.5 GB
-        "large-v3": 1_550_000_000,  # ~1.5 GB
-        "large": 1_550_000_000,      # ~1.5 GB (alias for large-v3)
-    }
+    # Read-only name -> approximate size in bytes, derived from _MODELS.
+    AVAILABLE_MODELS: Mapping[str, int] = MappingProxyType(
+        {name: spec.size for name, spec in _MODELS.items()}
+    )
     
     def __init__(self, models_dir: Optional[str] = None):
         """
@@ -94,47 +321,91 @@ class ModelManager:
         self.models_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Model directory: {self.models_dir}")
 
+        # Finish deletions interrupted by a previous exit.
+        for tombstone in self.models_dir.glob(_TOMBSTONE_GLOB):
+            if tombstone.is_dir():
+                logger.info(f"Removing leftover {tombstone.name}")
+                _delete_in_background(tombstone)
+
         # Track active downloads for cancellation
         self._active_downloads: Dict[str, threading.Event] = {}
+
+        # (models_dir mtime_ns, names of non-empty model directories).
+        # Creating or removing a model directory bumps the parent's mtime;
+        # changes made through this class also reset it explicitly.
+        self._downloaded_cache: Optional[Tuple[int, FrozenSet[str]]] = None
     
     def get_model_path(self, model_name: str) -> Path:
         """Get the path where a model should be stored"""
         return self.models_dir / model_name
     
+    def _downloaded_dirs(self) -> FrozenSet[str]:
+        """Names of model directories in models_dir that hold weights.
+
+        Built with a single scandir and cached until models_dir's mtime
+        changes.
+        """
+        try:
+            mtime = self.models_dir.stat().st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        cached = self._downloaded_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with os.scandir(self.models_dir) as entries:
+            # model.bin is the file that matters; one stat each instead of
+            # listing the directory.
+            present = frozenset(
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.isfile(os.path.join(entry.path, _MODEL_WEIGHTS))
+                and not os.path.exists(os.path.join(entry.path, _INCOMPLETE_MARKER))
+            )
+        self._downloaded_cache = (mtime, present)
+        return present
+
+    def _mark_incomplete(self, model_name: str):
+        """Flag a model directory as partially downloaded."""
+        model_path = self.get_model_path(model_name)
+        model_path.mkdir(parents=True, exist_ok=True)
+        (model_path / _INCOMPLETE_MARKER).touch()
+        self._invalidate_downloaded()
+
+    def _mark_complete(self, model_name: str):
+        """Clear the partial-download flag once every file is in place."""
+        try:
+            (self.get_model_path(model_name) / _INCOMPLETE_MARKER).unlink()
+        except FileNotFoundError:
+            pass
+        self._invalidate_downloaded()
+
+    def _invalidate_downloaded(self):
+        """Forget the cached directory scan after adding or removing a model."""
+        self._downloaded_cache = None
+
     def is_model_downloaded(self, model_name: str) -> bool:
         """Check if a model is already downloaded"""
-        model_path = self.get_model_path(model_name)
-        
-        # Check if the model directory exists and has files
-        if model_path.exists() and model_path.is_dir():
-            # Check for model files (should have at least model.bin or similar)
-            model_files = list(model_path.glob("*"))
-            return len(model_files) > 0
-        
-        return False
+        return model_name in self._downloaded_dirs()
     
     def list_downloaded_models(self) -> List[str]:
         """List all downloaded models"""
-        downloaded = []
-        
-        for model_name in self.AVAILABLE_MODELS.keys():
-            if self.is_model_downloaded(model_name):
-                downloaded.append(model_name)
-        
-        return downloaded
+        present = self._downloaded_dirs()
+        return [name for name in _MODELS if name in present]
     
     def list_available_models(self) -> List[Dict[str, Any]]:
         """List all available models with their status"""
-        models = []
-        
-        for model_name, size in self.AVAILABLE_MODELS.items():
-            models.append({
+        present = self._downloaded_dirs()
+        return [
+            {
                 "name": model_name,
-                "size": size,
-                "downloaded": self.is_model_downloaded(model_name)
-            })
-        
-        return models
+                "size": spec.size,
+                "downloaded": model_name in present,
+            }
+            for model_name, spec in _MODELS.items()
+        ]
     
     def ensure_model(self, model_name: str = "base") -> Optional[str]:
         """
@@ -146,7 +417,8 @@ class ModelManager:
         Returns:
             Path to the model directory if successful, None otherwise
         """
-        if model_name not in self.AVAILABLE_MODELS:
+        spec = _MODELS.get(model_name)
+        if spec is None:
             logger.error(f"Unknown model: {model_name}")
             return None
         
@@ -155,25 +427,11 @@ class ModelManager:
             logger.info(f"Model {model_name} already downloaded")
             return str(self.get_model_path(model_name))
         
-        # Download the model using huggingface_hub (same path as
-        # download_model_with_progress so is_model_downloaded detects it).
-        repo_id = _MODEL_REPOS.get(model_name)
-        if repo_id is None:
-            logger.error(f"No repo mapping for model: {model_name}")
-            return None
-
+        # Same parallel, resumable, verified path as DownloadModel; this
+        # caller just doesn't need progress.
         try:
             logger.info(f"Downloading model {model_name}...")
-            output_dir = str(self.models_dir / model_name)
-            huggingface_hub.snapshot_download(
-                repo_id,
-                local_dir=output_dir,
-                allow_patterns=_ALLOW_PATTERNS,
-            )
-            
-            logger.info(f"Model {model_name} downloaded successfully")
-            return str(self.get_model_path(model_name))
-            
+            return self.download_model_with_progress(model_name, lambda done, total: None)
         except Exception as e:
             logger.error(f"Failed to download model {model_name}: {e}")
             return None
@@ -196,84 +454,104 @@ class ModelManager:
             ValueError: If the model name is unknown.
             DownloadCanceled: If the download was canceled.
         """
-        repo_id = _MODEL_REPOS.get(model_name)
-        if repo_id is None:
+        spec = _MODELS.get(model_name)
+        if spec is None:
             raise ValueError(f"Unknown model: {model_name}")
+        repo_id = spec.repo
 
         if self.is_model_downloaded(model_name):
-            size = self.AVAILABLE_MODELS.get(model_name, 0)
-            progress_callback(size, size)
+            progress_callback(spec.size, spec.size)
             return str(self.get_model_path(model_name))
 
+        huggingface_hub = _hub()
+
         cancel_event = threading.Event()
         self._active_downloads[model_name] = cancel_event
 
         output_dir = str(self.models_dir / model_name)
 
         # Resolve which files to download from the repo that match our
-        # allow-patterns.
-        import fnmatch
-        all_files = huggingface_hub.list_repo_files(repo_id)
-        files_to_download = [
-            f for f in all_files
-            if any(fnmatch.fnmatch(f, pat) for pat in _ALLOW_PATTERNS)
-        ]
-
-        # Aggregate byte-level progress across all files.
-        # Each per-file tqdm reports its own (n, total).  We track every
-        # file's downloaded bytes and sum them to report overall progress.
-        file_progress: Dict[str, int] = {}   # filename -> bytes downloaded so far
-        total_bytes_all = 0                   # sum of all file sizes
-        lock = threading.Lock()
-
-        def _make_progress_class(filename: str):
-            """Return a tqdm subclass that aggregates this file's progress."""
-            cb = progress_callback
-            ce = cancel_event
-
-            class _FileProgress(_ProgressTqdm):
-                def __init__(self, *args, **kwargs):
-                    kwargs.setdefault("progress_callback", None)
-                    kwargs.setdefault("cancel_event", ce)
-                    super().__init__(*args, **kwargs)
-                    # Register this file's total once the bar is created.
-                    nonlocal total_bytes_all
-                    with lock:
-                        total_bytes_all += (self.total or 0)
-
-                def update(self, n=1):
-                    if ce and ce.is_set():
+        # allow-patterns, with the SHA256 published for LFS files.
+        info = huggingface_hub.model_info(repo_id, files_metadata=True)
+        expected_sha256 = {
+            sibling.rfilename: sibling.lfs.sha256 if sibling.lfs else None
+            for sibling in info.siblings
+            if _ALLOW_RE.match(sibling.rfilename)
+        }
+        files_to_download = list(expected_sha256)
+        digests: Dict[str, str] = {}
+
+        # One shared tqdm class; each per-file bar reports into the
+        # aggregator under its filename, and the aggregator sums them.
+        aggregator = _DownloadAggregator(progress_callback, cancel_event)
+        tqdm_class = _aggregating_tqdm_class()
+        retryable = _retryable_errors()
+
+        def _download_file(filename: str):
+            bar_class = functools.partial(tqdm_class, aggregator=aggregator, key=filename)
+            for attempt in range(1, _DOWNLOAD_ATTEMPTS + 1):
+                aggregator.check_canceled()
+                try:
+                    path = huggingface_hub.hf_hub_download(
+                        repo_id,
+                        filename=filename,
+                        local_dir=output_dir,
+                        tqdm_class=bar_class,
+                        etag_timeout=_ETAG_TIMEOUT,
+                    )
+                    break
+                except retryable as e:
+                    if attempt == _DOWNLOAD_ATTEMPTS:
+                        raise
+                    delay = min(_RETRY_MAX_DELAY, _RETRY_MIN_DELAY * 2 ** (attempt - 1))
+                    logger.warning(
+                        f"Download of {filename} failed ({e}), "
+                        f"retrying in {delay:.0f}s ({attempt}/{_DOWNLOAD_ATTEMPTS})"
+                    )
+                    if cancel_event.wait(delay):
                         raise DownloadCanceled("Download canceled by user")
-                    # Let tqdm handle self.n bookkeeping.
-                    super(_ProgressTqdm, self).update(n)
-                    with lock:
-                        file_progress[filename] = self.n
-                        downloaded = sum(file_progress.values())
-                    cb(downloaded, total_bytes_all)
-
-            return _FileProgress
+            digest = _sha256_file(path)
+            expected = expected_sha256[filename]
+            if expected is not None and digest != expected:
+                # Remove it so the next attempt fetches it from scratch.
+                os.remove(path)
+                raise DownloadCorrupted(
+                    f"{filename} failed SHA256 verification "
+                    f"(expected {expected}, got {digest})"
+                )
+            digests[filename] = digest
 
         try:
-            for filename in files_to_download:
-                if cancel_event.is_set():
-                    raise DownloadCanceled("Download canceled by user")
-                tqdm_cls = _make_progress_class(filename)
-                huggingface_hub.hf_hub_download(
-                    repo_id,
-                    filename=filename,
-                    local_dir=output_dir,
-                    tqdm_class=tqdm_cls,
-                )
+            self._mark_incomplete(model_name)
+            # Fetch files concurrently; the aggregator is lock-protected.
+            # Files left over from an interrupted attempt are resumed.
+            with ThreadPoolExecutor(
+                max_workers=_DOWNLOAD_WORKERS,
+                thread_name_prefix="model-download",
+            ) as pool:
+                futures = [
+                    pool.submit(_download_file, filename)
+                    for filename in files_to_download
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # Stop the remaining files before propagating.
+                    cancel_event.set()
+                    raise
+            with open(os.path.join(output_dir, _CHECKSUM_SIDECAR), "w", encoding="utf-8") as f:
+                f.writelines(f"{digests[name]}  {name}\n" for name in sorted(digests))
+            self._mark_complete(model_name)
             logger.info(f"Model {model_name} downloaded successfully")
             return output_dir
         except DownloadCanceled:
+            # Keep the partial files so the next attempt resumes them;
+            # delete_model removes them if the user no longer wants them.
             logger.info(f"Download of model {model_name} canceled")
-            import shutil
-            model_path = self.get_model_path(model_name)
-            if model_path.exists():
-                shutil.rmtree(model_path)
             raise
         finally:
+            aggregator.close()
             self._active_downloads.pop(model_name, None)
 
     def cancel_download(self, model_name: str) -> bool:
@@ -298,7 +576,7 @@ class ModelManager:
         Returns:
             True if successful, False otherwise
         """
-        if model_name not in self.AVAILABLE_MODELS:
+        if model_name not in _MODELS:
             logger.error(f"Unknown model: {model_name}")
             return False
         
@@ -310,8 +588,8 @@ class ModelManager:
         
         try:
             # Remove the model directory and all its contents
-            import shutil
-            shutil.rmtree(model_path)
+            _remove_tree(model_path)
+            self._invalidate_downloaded()
             logger.info(f"Deleted model {model_name}")
             return True
         except Exception as e:
@@ -320,12 +598,14 @@ class ModelManager:
     
     def get_model_info(self, model_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific model"""
-        if model_name not in self.AVAILABLE_MODELS:
+        spec = _MODELS.get(model_name)
+        if spec is None:
             return None
         
+        downloaded = self.is_model_downloaded(model_name)
         return {
             "name": model_name,
-            "size": self.AVAILABLE_MODELS[model_name],
-            "downloaded": self.is_model_downloaded(model_name),
-            "path": str(self.get_model_path(model_name)) if self.is_model_downloaded(model_name) else None
+            "size": spec.size,
+            "downloaded": downloaded,
+            "path": str(self.get_model_path(model_name)) if downloaded else None
         }
\ No newline at end of file
@@ -1,20 +1,39 @@
-"""Transcription engine using faster-whisper"""
+"""Transcription engine using faster-whisper
+
+faster-whisper (and with it CTranslate2, tokenizers and numpy) is imported
+on first use via ``_whisper()``; keep this module's top level cheap, since
+the server imports it before it starts serving.
+"""
 
 import asyncio
 import collections
+import functools
+import gc
+import hashlib
+import importlib.util
 import logging
 import os
+import re
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Dict, Any, Callable
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, FrozenSet, List, Tuple
 import time
 
-from faster_whisper import WhisperModel
-import requests
+import httpx
+
+# orjson parses translation payloads faster when it is installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from ..db.dao import Database
 from ..proto import scribe_pb2
-from .gpu import get_device, get_compute_type
-from .model_manager import ModelManager
+from .gpu import get_device, get_compute_type, get_free_gpu_memory
+from .model_manager import ModelManager, _file_digest
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +47,147 @@ EventCallback = Callable[[str, Dict[str, Any]], None]
 _MODEL_CACHE_BUDGET = int(os.environ.get(
     'SCRIBE_MODEL_CACHE_BYTES', 2 * 1024 * 1024 * 1024
 ))
+# Cached models unused for this many seconds are dropped once no job is
+# running; 0 keeps them until evicted by the memory budget.
+_MODEL_IDLE_TIMEOUT = float(os.environ.get('SCRIBE_MODEL_IDLE_SECONDS', 300))
 _TRANSLATE_API_URL = "https://translate.googleapis.com/translate_a/single"
 _SUPPORTED_TRANSLATION_LANGUAGES = {
     "en", "es", "fr", "de", "it", "pt", "ja", "zh", "ko"
 }
+# Segments are written to the DB once this many are buffered, or once the
+# oldest buffered segment is this many seconds old.
+_SEGMENT_FLUSH_SIZE = 50
+_SEGMENT_FLUSH_INTERVAL = 2.0
+# Flushed batches waiting for the DB writer task before the job loop blocks.
+_WRITE_QUEUE_SIZE = 4
+# Minimum seconds between job progress writes during transcription, and
+# the minimum progress change worth writing.
+_PROGRESS_WRITE_INTERVAL = 0.5
+_PROGRESS_WRITE_STEP = 0.01
+# Segments translated per Google Translate request, and the separator used
+# to pack them into one query.
+_TRANSLATE_BATCH_SIZE = 10
+_TRANSLATE_SEPARATOR = "\n\u241f\n"
+# Translations kept in memory across jobs, keyed by (text, target language).
+_TRANSLATION_CACHE_SIZE = 4096
+# Retries for throttled or failing translation responses, with doubling
+# backoff starting at _TRANSLATE_RETRY_DELAY seconds.
+_TRANSLATE_RETRIES = 3
+_TRANSLATE_RETRY_DELAY = 0.5
+_TRANSLATE_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Clips shorter than this many seconds fit in one Whisper window, so the
+# Silero VAD pass is skipped for them.
+_VAD_MIN_DURATION = float(os.environ.get('SCRIBE_VAD_MIN_SECONDS', 30))
+# VAD chunks decoded together by the batched pipeline.  SCRIBE_BATCH_SIZE
+# overrides the automatic choice; 1 decodes sequentially.
+_BATCH_SIZE_OVERRIDE = int(os.environ.get('SCRIBE_BATCH_SIZE', 0))
+_CPU_BATCH_SIZE = 8
+_MAX_GPU_BATCH_SIZE = 32
+# CTranslate2 CPU threads per model family: small models stop scaling past
+# a few cores, and extra threads only contend for cache.  Capped at the
+# machine's CPU count; SCRIBE_CPU_THREADS overrides.
+_CPU_THREADS = {"tiny": 4, "base": 4, "small": 8, "medium": 8, "large": 16}
+_CPU_THREADS_OVERRIDE = int(os.environ.get('SCRIBE_CPU_THREADS', 0))
+# CTranslate2 CUDA options, applied before the first CUDA model is built
+# unless already set in the environment: TF32 tensor cores for float32
+# matmuls (Ampere and newer).
+_CT2_CUDA_ENV = {'CT2_CUDA_ALLOW_TF32': '1'}
+# Settings key remembering the last model a job ran, preloaded at startup.
+_LAST_USED_MODEL_KEY = 'last_used_model'
+
+
+@functools.lru_cache(maxsize=None)
+def _whisper():
+    """Import faster_whisper on first use."""
+    import faster_whisper
+
+    return faster_whisper
+
+
+@functools.lru_cache(maxsize=None)
+def _supported_compute_types(device: str) -> FrozenSet[str]:
+    """Compute types CTranslate2 supports on a device; empty if unknown."""
+    try:
+        import ctranslate2
+
+        return frozenset(ctranslate2.get_supported_compute_types(device))
+    except Exception as e:
+        logger.debug(f"Could not query compute types for {device}: {e}")
+        return frozenset()
+
+
+def _resolve_device(enable_gpu: bool,
+                    compute_type: Optional[str] = None) -> Tuple[str, str]:
+    """Pick the inference device and a compute type it can run.
+
+    ``None``/``"auto"`` picks the hardware default; a requested type the
+    device does not support (e.g. float16 on CPU) falls back to it with a
+    warning.  Blocking: probes the GPU on first use.
+    """
+    device = get_device() if enable_gpu else "cpu"
+    default = get_compute_type(enable_gpu)
+    if not compute_type or compute_type == "auto":
+        return device, default
+    supported = _supported_compute_types(device)
+    if supported and compute_type not in supported:
+        logger.warning(
+            f"compute_type {compute_type} is not supported on {device}, "
+            f"using {default}"
+        )
+        return device, default
+    return device, compute_type
+
+
+def _content_key(audio_path: str, *options: Optional[str]) -> str:
+    """Hash an audio file's bytes together with the options that shape
+    its transcript."""
+    try:
+        from blake3 import blake3
+    except ImportError:
+        blake3 = hashlib.sha256
+    with open(audio_path, 'rb') as f:
+        digest = _file_digest(f, blake3).hexdigest()
+    return hashlib.sha256(
+        "\0".join([digest, *(option or '' for option in options)]).encode()
+    ).hexdigest()
+
+
+def _current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, or None if unknown."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def _prefetch_weights(model_dir: str):
+    """Ask the kernel to start reading model.bin ahead of the load."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(os.path.join(model_dir, 'model.bin'), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _cpu_threads(model_name: str) -> int:
+    """CTranslate2 intra-op threads for a model on the CPU."""
+    if _CPU_THREADS_OVERRIDE > 0:
+        return _CPU_THREADS_OVERRIDE
+    family = model_name.split('.')[0].split('-')[0]
+    return min(_CPU_THREADS.get(family, 8), os.cpu_count() or 1)
 
 
 class _ModelCache:
@@ -42,59 +198,137 @@ class _ModelCache:
     least-recently-used entry when loading a new model would exceed
     the budget.
 
-    The *estimated* size of each model is taken from
-    ``ModelManager.AVAILABLE_MODELS``; it doesn't reflect actual
-    process RSS but is a good-enough proxy for eviction decisions.
+    Each model is weighed by the RSS growth measured around its load.
+    When RSS can't be read, and as a floor for GPU models whose weights
+    live in device memory, the size from ``ModelManager.AVAILABLE_MODELS``
+    is used instead.
+
+    A single instance is shared by every engine in the process; its
+    methods are guarded by a lock so engines on other threads can use it.
     """
 
     def __init__(self, budget: int):
         self._budget = budget
+        self._lock = threading.Lock()
         # OrderedDict gives us O(1) move-to-end (LRU touch) and
         # pop-from-front (evict oldest).
         self._entries: collections.OrderedDict[
-            tuple, tuple[WhisperModel, int]  # (model, estimated_bytes)
+            tuple, tuple['WhisperModel', int]  # (model, estimated_bytes)
         ] = collections.OrderedDict()
+        self._last_used: Dict[tuple, float] = {}
         self._current_bytes = 0
 
-    def get(self, key: tuple) -> Optional[WhisperModel]:
+    def get(self, key: tuple) -> Optional['WhisperModel']:
         """Return a cached model (and mark it as recently used), or None."""
-        entry = self._entries.get(key)
-        if entry is None:
-            return None
-        self._entries.move_to_end(key)  # mark as most-recently-used
-        return entry[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)  # mark as most-recently-used
+            self._last_used[key] = time.monotonic()
+            return entry[0]
 
-    def put(self, key: tuple, model: WhisperModel, estimated_bytes: int):
+    def put(self, key: tuple, model: 'WhisperModel', estimated_bytes: int):
         """Insert a model, evicting LRU entries if the budget is exceeded."""
-        # If this exact key already exists, remove the old entry first.
-        if key in self._entries:
-            _, old_bytes = self._entries.pop(key)
-            self._current_bytes -= old_bytes
-
-        # Evict LRU entries until there is room (or cache is empty).
-        while (
-            self._entries
-            and self._current_bytes + estimated_bytes > self._budget
-        ):
-            evicted_key, (_, evicted_bytes) = self._entries.popitem(last=False)
-            self._current_bytes -= evicted_bytes
+        with self._lock:
+            # If this exact key already exists, remove the old entry first.
+            if key in self._entries:
+                _, old_bytes = self._entries.pop(key)
+                self._current_bytes -= old_bytes
+
+            # Evict LRU entries until there is room (or cache is empty).
+            while (
+                self._entries
+                and self._current_bytes + estimated_bytes > self._budget
+            ):
+                evicted_key, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._last_used.pop(evicted_key, None)
+                self._current_bytes -= evicted_bytes
+                logger.info(
+                    f"Evicted model {evicted_key[0]} from cache "
+                    f"({evicted_bytes / 1_000_000:.0f} MB freed)"
+                )
+
+            self._entries[key] = (model, estimated_bytes)
+            self._last_used[key] = time.monotonic()
+            self._current_bytes += estimated_bytes
             logger.info(
-                f"Evicted model {evicted_key[0]} from cache "
-                f"({evicted_bytes / 1_000_000:.0f} MB freed)"
+                f"Model cache: {len(self._entries)} model(s), "
+                f"~{self._current_bytes / 1_000_000:.0f} MB used / "
+                f"{self._budget / 1_000_000:.0f} MB budget"
             )
 
-        self._entries[key] = (model, estimated_bytes)
-        self._current_bytes += estimated_bytes
-        logger.info(
-            f"Model cache: {len(self._entries)} model(s), "
-            f"~{self._current_bytes / 1_000_000:.0f} MB used / "
-            f"{self._budget / 1_000_000:.0f} MB budget"
-        )
+    def evict_idle(self, max_idle: float) -> int:
+        """Drop models unused for at least ``max_idle`` seconds.
+
+        Returns the number of models evicted.  A collection is run
+        afterwards so the weights are released right away rather than at
+        the next GC cycle.
+        """
+        with self._lock:
+            now = time.monotonic()
+            stale = [
+                key for key, used in self._last_used.items()
+                if now - used >= max_idle
+            ]
+            for key in stale:
+                _, evicted_bytes = self._entries.pop(key)
+                del self._last_used[key]
+                self._current_bytes -= evicted_bytes
+                logger.info(
+                    f"Evicted idle model {key[0]} from cache "
+                    f"({evicted_bytes / 1_000_000:.0f} MB freed)"
+                )
+        if stale:
+            gc.collect()
+        return len(stale)
 
     def clear(self):
         """Drop all cached models."""
-        self._entries.clear()
-        self._current_bytes = 0
+        with self._lock:
+            self._entries.clear()
+            self._last_used.clear()
+            self._current_bytes = 0
+
+
+# Process-wide model cache shared by every TranscriptionEngine, so two
+# engines never hold separate copies of the same model.
+_MODEL_CACHE = _ModelCache(_MODEL_CACHE_BUDGET)
+
+class _TranslationCache:
+    """Thread-safe LRU of translated texts, shared by every job."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[tuple, str] = collections.OrderedDict()
+
+    def get(self, text: str, target_language: str) -> Optional[str]:
+        key = (text, target_language)
+        with self._lock:
+            translated = self._entries.get(key)
+            if translated is not None:
+                self._entries.move_to_end(key)
+            return translated
+
+    def put(self, text: str, target_language: str, translated: str):
+        with self._lock:
+            self._entries[(text, target_language)] = translated
+            self._entries.move_to_end((text, target_language))
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_TRANSLATION_CACHE = _TranslationCache(_TRANSLATION_CACHE_SIZE)
+
+# (device, compute_type) -> monotonic time its WhisperModel init failed
+# for a device/runtime reason.  Loads within _FAILED_DEVICE_TTL go
+# straight to the CPU fallback instead of retrying the failing init.
+_FAILED_DEVICES: Dict[Tuple[str, str], float] = {}
+_FAILED_DEVICE_TTL = 600.0
+# Init errors that point at the GPU runtime rather than at the request
+# (bad compute_type), the model file, or a transient out-of-memory.
+_DEVICE_ERROR_RE = re.compile(r'cuda|cudnn|cublas|driver|no .*device', re.IGNORECASE)
 
 
 class TranscriptionEngine:
@@ -110,15 +344,75 @@ class TranscriptionEngine:
         """
         self.db = db
         self.model_manager = model_manager
-        self.active_jobs: Dict[str, bool] = {}  # Track cancellation
-        self._executor = ThreadPoolExecutor(max_workers=1)
-        self._model_cache = _ModelCache(_MODEL_CACHE_BUDGET)
+        # job_id -> event set when the job is cancelled (or has ended); the
+        # whisper thread checks it too.
+        self.active_jobs: Dict[str, threading.Event] = {}
+        # job_id -> queue the job's loop is waiting on, so a cancel can wake
+        # it without waiting for whisper's next segment.
+        self._segment_queues: Dict[str, asyncio.Queue] = {}
+        # Whisper decoding is serialized on its own thread; model loading
+        # and duration probes use a separate pool so they never queue
+        # behind it.
+        self._compute_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper"
+        )
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="engine-io"
+        )
+        # Async client for translation requests: they run on the event loop
+        # rather than tying up I/O threads, over kept-alive connections
+        # (multiplexed over HTTP/2 when the h2 package is installed).
+        self._http = httpx.AsyncClient(
+            timeout=10,
+            transport=httpx.AsyncHTTPTransport(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=16),
+                retries=3,  # connection failures only
+            ),
+        )
+        self._model_cache = _MODEL_CACHE
+        # In-flight loads, so a job arriving during warm-up waits for the
+        # same load instead of starting a second one.
+        self._model_loads: Dict[tuple, asyncio.Future] = {}
+        # Pending idle-eviction check, restarted whenever a job finishes.
+        self._idle_eviction: Optional[asyncio.Task] = None
+
+    def default_compute_type(self) -> str:
+        """Compute type for jobs that don't request one (the setting)."""
+        return self.db.get_setting('compute_type', 'auto')
+
+    async def warm_up(self):
+        """Preload the most recently used model into the model cache.
+
+        Only models already on disk are loaded; startup never triggers a
+        download.  Failures are logged and otherwise ignored.
+        """
+        model_name = self.db.get_setting(_LAST_USED_MODEL_KEY)
+        if not model_name:
+            return
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(
+            self._io_executor, self.model_manager.is_model_downloaded, model_name
+        ):
+            return
+        # Resolve exactly as a job with default options would (GPU enabled,
+        # the compute_type setting), so the first job hits the cache.
+        device, compute_type = await loop.run_in_executor(
+            self._io_executor, _resolve_device, True, self.default_compute_type()
+        )
+        try:
+            await self._get_or_load_model(model_name, device, compute_type)
+            logger.info(f"Preloaded model {model_name} ({device}/{compute_type})")
+        except Exception as e:
+            logger.warning(f"Could not preload model {model_name}: {e}")
+        self._schedule_idle_eviction()
         
     async def run_job(self, job_id: str, audio_path: str,
                      model_name: str = "base", language: str = None,
                      translate: bool = False, translate_to_language: str = None,
                      initial_prompt: str = None,
                      enable_gpu: bool = True,
+                     compute_type: Optional[str] = None,
                      on_event: EventCallback = None) -> bool:
         """
         Run a transcription job.
@@ -132,6 +426,9 @@ class TranscriptionEngine:
             translate_to_language: Optional translation target language code
             initial_prompt: Optional prompt to guide transcription
             enable_gpu: Whether to use GPU if available
+            compute_type: CTranslate2 compute type (e.g. "int8",
+                "int8_float16", "float16"); None or "auto" picks one for
+                the hardware, as does a type the device cannot run
             on_event: Optional callback fired for each transcription event
 
         Returns:
@@ -155,8 +452,12 @@ class TranscriptionEngine:
             if on_event is not None:
                 on_event(job_id, {'status': status, 'progress': progress, **kwargs})
 
+        loop = asyncio.get_running_loop()
+        writer: Optional[asyncio.Task] = None
+
         # Mark job as active
-        self.active_jobs[job_id] = True
+        cancel_event = threading.Event()
+        self.active_jobs[job_id] = cancel_event
 
         try:
             if target_language is not None and (
@@ -167,7 +468,9 @@ class TranscriptionEngine:
                 )
 
             # Validate audio file exists
-            if not os.path.exists(audio_path):
+            if not await loop.run_in_executor(
+                self._io_executor, os.path.exists, audio_path
+            ):
                 error_msg = f"Audio file not found: {audio_path}"
                 logger.error(error_msg)
                 await self.db.update_job_status(job_id, scribe_pb2.JobStatus.FAILED, error_msg)
@@ -178,10 +481,44 @@ class TranscriptionEngine:
             await self.db.update_job_status(job_id, scribe_pb2.JobStatus.RUNNING)
             _emit(scribe_pb2.JobStatus.RUNNING)
 
+            # Reuse the transcript of an earlier job on the same audio with
+            # the same options instead of running whisper again.
+            content_key = await loop.run_in_executor(
+                self._io_executor,
+                functools.partial(
+                    _content_key, audio_path, model_name, language,
+                    target_language, initial_prompt,
+                ),
+            )
+            source_job_id = await self.db.find_completed_job(content_key)
+            await self.db.set_job_content_key(job_id, content_key)
+            if source_job_id is not None:
+                logger.info(f"Reusing transcript of job {source_job_id}")
+                await self.db.copy_segments(source_job_id, job_id)
+                # Published a flush-sized page at a time, like a live run:
+                # each page is a separate read, so subscribers get the loop
+                # between pages instead of one burst of the whole transcript.
+                async for batch in self.db.iter_segments(
+                    job_id, batch_size=_SEGMENT_FLUSH_SIZE
+                ):
+                    if cancel_event.is_set():
+                        break
+                    for segment_data in batch:
+                        _emit(scribe_pb2.JobStatus.RUNNING, segment=segment_data)
+                    await asyncio.sleep(0)
+                # Completes only a job still RUNNING, so a cancel that lands
+                # during the replay is never overwritten.
+                if cancel_event.is_set() or not await self.db.complete_job_if_running(job_id):
+                    logger.info(f"Job {job_id} was cancelled")
+                    await self.db.cancel_job_if_active(job_id)
+                    _emit(scribe_pb2.JobStatus.CANCELED, final=True)
+                    return False
+                _emit(scribe_pb2.JobStatus.COMPLETED, progress=1.0, final=True)
+                return True
+
             # Ensure model is available (blocking I/O, run in executor)
-            loop = asyncio.get_running_loop()
             model_path = await loop.run_in_executor(
-                self._executor, self.model_manager.ensure_model, model_name
+                self._io_executor, self.model_manager.ensure_model, model_name
             )
             if not model_path:
                 error_msg = f"Failed to load model: {model_name}"
@@ -190,9 +527,10 @@ class TranscriptionEngine:
                 _emit(scribe_pb2.JobStatus.FAILED, error=error_msg, final=True)
                 return False
 
-            # Determine device and compute type
-            device = get_device() if enable_gpu else "cpu"
-            compute_type = get_compute_type(enable_gpu)
+            # Determine device and compute type (may probe the GPU)
+            device, compute_type = await loop.run_in_executor(
+                self._io_executor, _resolve_device, enable_gpu, compute_type
+            )
 
             logger.info(f"Using device: {device}, compute_type: {compute_type}")
 
@@ -200,104 +538,224 @@ class TranscriptionEngine:
             model = await self._get_or_load_model(
                 model_name, device, compute_type
             )
+            if self.db.get_setting(_LAST_USED_MODEL_KEY) != model_name:
+                await self.db.set_setting(_LAST_USED_MODEL_KEY, model_name)
 
-            # Get audio duration for progress calculation (non-blocking)
-            loop = asyncio.get_running_loop()
-            audio_duration = await loop.run_in_executor(
-                self._executor, self._get_audio_duration, audio_path
+            # Decode and resample once, off the loop; whisper gets the
+            # samples and the duration falls out of their count.
+            sampling_rate = model.feature_extractor.sampling_rate
+            audio = await loop.run_in_executor(
+                self._io_executor,
+                functools.partial(_whisper().decode_audio, audio_path, sampling_rate=sampling_rate),
             )
+            audio_duration = len(audio) / sampling_rate
 
             # Run blocking transcription in executor
             logger.info("Starting transcription...")
             start_time = time.time()
 
+            batch_size = self._batch_size(model_name, device)
+            # The batched pipeline decodes an unsegmented clip as a single
+            # window, so without VAD it only accepts clips shorter than 30 s.
+            if batch_size == 1:
+                use_vad = audio_duration > _VAD_MIN_DURATION
+            else:
+                use_vad = audio_duration >= min(_VAD_MIN_DURATION, 30.0)
+
             def _transcribe():
-                return model.transcribe(
-                    audio_path,
+                options = dict(
                     language=language,
                     task="translate" if target_language == "en" else "transcribe",
                     initial_prompt=initial_prompt,
-                    vad_filter=True,
-                    vad_parameters=dict(min_silence_duration_ms=500),
+                    vad_filter=use_vad,
+                    # Half the default padding around speech trims the
+                    # silence the decoder sees at each chunk boundary.
+                    vad_parameters=dict(min_silence_duration_ms=500, speech_pad_ms=200),
                 )
+                if batch_size > 1:
+                    # Decodes several VAD chunks per forward pass.  The
+                    # pipeline defaults to one segment per chunk (up to
+                    # 30 s); timestamps keep Whisper's sentence-level
+                    # segments that editing and subtitles rely on.
+                    pipeline = _whisper().BatchedInferencePipeline(model=model)
+                    return pipeline.transcribe(
+                        audio,
+                        batch_size=batch_size,
+                        without_timestamps=False,
+                        **options,
+                    )
+                return model.transcribe(audio, **options)
 
             segments_iter, info = await loop.run_in_executor(
-                self._executor, _transcribe
+                self._compute_executor, _transcribe
             )
 
             # Process segments (iterating the generator is also blocking)
             segment_count = 0
             processed_duration = 0.0
-            segment_batch = []
-            translation_cache: Dict[str, str] = {}
+            # Fixed slots reused for every batch; batch_len counts the live ones.
+            segment_batch: List[Optional[Dict[str, Any]]] = [None] * _SEGMENT_FLUSH_SIZE
+            batch_len = 0
+            last_flush = time.monotonic()
+            last_progress_write = 0.0
+            last_progress = 0.0
+
+            # A writer task commits flushed batches, so SQLite commits never
+            # hold up translation or event delivery.  Each item is
+            # (segments, progress or None); None ends the task.
+            write_queue: asyncio.Queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+
+            async def _db_writer():
+                while True:
+                    item = await write_queue.get()
+                    if item is None:
+                        return
+                    rows, progress = item
+                    async with self.db.transaction():
+                        await self.db.insert_segments_batch(job_id, rows)
+                        if progress is not None:
+                            await self.db.update_job_progress(job_id, progress)
+
+            async def _write(item):
+                if writer.done():
+                    writer.result()  # re-raise the writer's failure
+                if not write_queue.full():
+                    write_queue.put_nowait(item)
+                    return
+                # A full queue is only drained by the writer; if it fails
+                # mid-batch the put would wait forever, so race the two.
+                put = loop.create_task(write_queue.put(item))
+                try:
+                    done, _ = await asyncio.wait(
+                        {put, writer}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    if not put.done():
+                        put.cancel()
+                if put not in done:
+                    writer.result()  # re-raise the writer's failure
+                    raise RuntimeError("DB writer stopped before the job ended")
+
+            writer = loop.create_task(_db_writer())
+
+            async def _flush(progress: float, now: float):
+                """Queue the buffered segments (and, throttled, progress)."""
+                nonlocal batch_len, last_flush, last_progress_write, last_progress
+                if (
+                    now - last_progress_write >= _PROGRESS_WRITE_INTERVAL
+                    and progress - last_progress > _PROGRESS_WRITE_STEP
+                ):
+                    last_progress_write = now
+                    last_progress = progress
+                else:
+                    progress = None
+                await _write((segment_batch[:batch_len], progress))
+                batch_len = 0
+                last_flush = now
+            translating = target_language is not None and target_language != "en"
+            untranslated: List[Dict[str, Any]] = []
 
-            def _next_segment(it):
-                """Get next segment from iterator, returns None at end."""
+            # Whisper iterates on the compute thread and hands segments to
+            # the loop through a queue, decoding ahead while earlier segments
+            # are translated and flushed.  None marks the end of the stream;
+            # an exception instance is re-raised here.
+            segment_queue: asyncio.Queue = asyncio.Queue()
+            self._segment_queues[job_id] = segment_queue
+
+            def _produce():
+                put = functools.partial(loop.call_soon_threadsafe, segment_queue.put_nowait)
                 try:
-                    return next(it)
-                except StopIteration:
-                    return None
+                    # Checked before each decode step, so a cancel stops
+                    # whisper without waiting for the consumer.
+                    while not cancel_event.is_set():
+                        item = next(segments_iter, None)
+                        if item is None:
+                            break
+                        put(item)
+                except Exception as e:
+                    put(e)
+                finally:
+                    put(None)
 
+            loop.run_in_executor(self._compute_executor, _produce)
             while True:
-                if not self.active_jobs.get(job_id, False):
+                if cancel_event.is_set():
                     logger.info(f"Job {job_id} was cancelled")
+                    # Keep the segments already queued for writing.
+                    await _write(None)
+                    await writer
                     await self.db.update_job_status(job_id, scribe_pb2.JobStatus.CANCELED)
                     _emit(scribe_pb2.JobStatus.CANCELED, final=True)
                     return False
 
-                segment = await loop.run_in_executor(
-                    self._executor, _next_segment, segments_iter
-                )
+                segment = await segment_queue.get()
+                if isinstance(segment, Exception):
+                    raise segment
+                if segment is None:
+                    if cancel_event.is_set():
+                        continue  # stopped early by a cancel; handled above
+                    if not untranslated:
+                        break
+                    # End of stream: translate whatever is still buffered.
+                    ready = await self._translate_segments(
+                        untranslated, target_language
+                    )
+                    untranslated = []
+                else:
+                    segment_data = {
+                        'idx': segment_count,
+                        'start': segment.start,
+                        'end': segment.end,
+                        'text': segment.text.strip(),
+                    }
+                    segment_count += 1
+                    if not translating:
+                        ready = [segment_data]
+                    else:
+                        # Translate in batches; segments are emitted once
+                        # their batch comes back.
+                        untranslated.append(segment_data)
+                        if len(untranslated) < _TRANSLATE_BATCH_SIZE:
+                            continue
+                        ready = await self._translate_segments(
+                            untranslated, target_language
+                        )
+                        untranslated = []
+
+                for segment_data in ready:
+                    segment_batch[batch_len] = segment_data
+                    batch_len += 1
+                    processed_duration = segment_data['end']
+
+                    # Emit event for each segment immediately
+                    progress = min(processed_duration / audio_duration, 1.0) if audio_duration > 0 else 0.0
+                    _emit(scribe_pb2.JobStatus.RUNNING, progress=progress, segment=segment_data)
+
+                    # Flush to the DB in batches; events stay per-segment.
+                    if batch_len == _SEGMENT_FLUSH_SIZE:
+                        await _flush(progress, time.monotonic())
+
+                now = time.monotonic()
+                if batch_len and now - last_flush >= _SEGMENT_FLUSH_INTERVAL:
+                    await _flush(progress, now)
+
                 if segment is None:
                     break
 
-                segment_data = {
-                    'idx': segment_count,
-                    'start': segment.start,
-                    'end': segment.end,
-                    'text': segment.text.strip(),
-                }
-                if target_language and target_language != "en" and segment_data['text']:
-                    source_text = segment_data['text']
-                    translated_text = translation_cache.get(source_text)
-                    if translated_text is None:
-                        translated_text = await loop.run_in_executor(
-                            self._executor,
-                            self._translate_text,
-                            source_text,
-                            target_language,
-                        )
-                        translation_cache[source_text] = translated_text
-                    segment_data['text'] = translated_text
-
-                segment_batch.append(segment_data)
-                segment_count += 1
-                processed_duration = segment.end
-
-                # Emit event for each segment immediately
-                progress = min(processed_duration / audio_duration, 1.0) if audio_duration > 0 else 0.0
-                _emit(scribe_pb2.JobStatus.RUNNING, progress=progress, segment=segment_data)
-
-                # Flush batch to DB every 10 segments
-                if len(segment_batch) >= 10:
-                    await self.db.insert_segments_batch(job_id, segment_batch)
-                    segment_batch = []
-                    await self.db.update_job_progress(job_id, progress)
-
-            # Flush remaining segments
-            if segment_batch:
-                await self.db.insert_segments_batch(job_id, segment_batch)
-                if audio_duration > 0:
-                    progress = min(processed_duration / audio_duration, 1.0)
-                    await self.db.update_job_progress(job_id, progress)
+            # Flush remaining segments and wait for the writer to drain.
+            if batch_len:
+                await _write((segment_batch[:batch_len], None))
+            await _write(None)
+            await writer
 
             # Mark as completed
             elapsed_time = time.time() - start_time
             logger.info(f"Transcription completed in {elapsed_time:.2f} seconds")
             logger.info(f"Processed {segment_count} segments")
 
-            await self.db.update_job_status(job_id, scribe_pb2.JobStatus.COMPLETED)
+            # Buffered progress is folded into the status write.
             await self.db.update_job_progress(job_id, 1.0)
+            await self.db.update_job_status(job_id, scribe_pb2.JobStatus.COMPLETED)
             _emit(scribe_pb2.JobStatus.COMPLETED, progress=1.0, final=True)
 
             return True
@@ -310,28 +768,96 @@ class TranscriptionEngine:
             return False
 
         finally:
-            # Remove from active jobs
+            # Remove from active jobs and stop the whisper thread if it is
+            # still decoding.
             self.active_jobs.pop(job_id, None)
+            self._segment_queues.pop(job_id, None)
+            cancel_event.set()
+            if writer is not None and not writer.done():
+                writer.cancel()
+            self._schedule_idle_eviction()
+
+    def _schedule_idle_eviction(self):
+        """(Re)start the timer that drops models left idle in the cache."""
+        if _MODEL_IDLE_TIMEOUT <= 0:
+            return
+        if self._idle_eviction is not None:
+            self._idle_eviction.cancel()
+        self._idle_eviction = asyncio.get_running_loop().create_task(
+            self._evict_idle_models()
+        )
+
+    async def _evict_idle_models(self):
+        """Evict idle cached models once the timeout passes with no jobs."""
+        await asyncio.sleep(_MODEL_IDLE_TIMEOUT)
+        if self.active_jobs:
+            return  # rescheduled when the running jobs finish
+        await asyncio.get_running_loop().run_in_executor(
+            self._io_executor, self._model_cache.evict_idle, _MODEL_IDLE_TIMEOUT
+        )
+
+    async def _translate_segments(self, segments: List[Dict[str, Any]],
+                                  target_language: str) -> List[Dict[str, Any]]:
+        """Translate segment texts in place, fetching uncached ones in one request."""
+        translations: Dict[str, Optional[str]] = {
+            seg['text']: _TRANSLATION_CACHE.get(seg['text'], target_language)
+            for seg in segments
+            if seg['text']
+        }
+        missing = [text for text, translated in translations.items() if translated is None]
+        if missing:
+            fetched = await self._translate_texts(missing, target_language)
+            for text, translated in zip(missing, fetched):
+                _TRANSLATION_CACHE.put(text, target_language, translated)
+                translations[text] = translated
+        for seg in segments:
+            if seg['text']:
+                seg['text'] = translations[seg['text']]
+        return segments
 
-    def _translate_text(self, text: str, target_language: str) -> str:
+    async def _translate_texts(self, texts: List[str], target_language: str) -> List[str]:
+        """Translate several texts with a single request.
+
+        The texts are joined with a separator and split back apart; if the
+        service mangles the separator, the texts are translated one per
+        request, concurrently.
+        """
+        if len(texts) == 1:
+            return [await self._translate_text(texts[0], target_language)]
+
+        joined = await self._translate_text(_TRANSLATE_SEPARATOR.join(texts), target_language)
+        parts = [part.strip() for part in joined.split(_TRANSLATE_SEPARATOR.strip())]
+        if len(parts) == len(texts) and all(parts):
+            return parts
+
+        logger.debug("Batched translation lost its separators, translating one by one")
+        return list(await asyncio.gather(
+            *(self._translate_text(text, target_language) for text in texts)
+        ))
+
+    async def _translate_text(self, text: str, target_language: str) -> str:
         """Translate text to a target language using Google Translate API."""
         if not text.strip():
             return text
 
-        response = requests.get(
-            _TRANSLATE_API_URL,
-            params={
-                "client": "gtx",
-                "sl": "auto",
-                "tl": target_language,
-                "dt": "t",
-                "q": text,
-            },
-            timeout=10,
-        )
+        params = {
+            "client": "gtx",
+            "sl": "auto",
+            "tl": target_language,
+            "dt": "t",
+            "q": text,
+        }
+        for attempt in range(_TRANSLATE_RETRIES + 1):
+            response = await self._http.get(_TRANSLATE_API_URL, params=params)
+            if (
+                response.status_code not in _TRANSLATE_RETRY_STATUSES
+                or attempt == _TRANSLATE_RETRIES
+            ):
+                break
+            await asyncio.sleep(_TRANSLATE_RETRY_DELAY * 2 ** attempt)
         response.raise_for_status()
 
-        payload = response.json()
+        payload = _json_loads(response.content)
         translated_chunks = payload[0] if payload and len(payload) > 0 else []
         translated_text = "".join(
             chunk[0] for chunk in translated_chunks if chunk and chunk[0]
@@ -342,7 +868,7 @@ class TranscriptionEngine:
         return translated_text
     
     async def _get_or_load_model(self, model_name: str, device: str,
-                                compute_type: str) -> WhisperModel:
+                                compute_type: str) -> 'WhisperModel':
         """Load a WhisperModel, using a memory-budgeted LRU cache."""
         cache_key = (model_name, device, compute_type)
 
@@ -351,76 +877,133 @@ class TranscriptionEngine:
             logger.info(f"Using cached model: {model_name} ({device}/{compute_type})")
             return cached
 
+        pending = self._model_loads.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
         loop = asyncio.get_running_loop()
+        pending = loop.create_future()
+        self._model_loads[cache_key] = pending
+        try:
+            model = await self._load_model(model_name, device, compute_type, loop)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            # Nobody may be waiting; mark it retrieved to avoid a warning.
+            pending.exception()
+            raise
+        else:
+            pending.set_result(model)
+            return model
+        finally:
+            self._model_loads.pop(cache_key, None)
+
+    async def _load_model(self, model_name: str, device: str, compute_type: str,
+                          loop: asyncio.AbstractEventLoop) -> 'WhisperModel':
+        """Load a WhisperModel on the executor and add it to the cache."""
+        cache_key = (model_name, device, compute_type)
 
         # Resolve to the canonical path (shared/models/<name>) so
         # faster_whisper loads from the same directory that
         # ModelManager.is_model_downloaded() checks.
         model_path = self.model_manager.get_model_path(model_name)
-        model_id = str(model_path) if model_path.exists() else model_name
+        local = model_path.exists()
+        model_id = str(model_path) if local else model_name
+
+        cpu_threads = _cpu_threads(model_name)
 
         def _load():
+            _prefetch_weights(model_id)
+            rss_before = _current_rss()
+            model = _init()
+            rss_after = _current_rss()
+            if rss_before is None or rss_after is None:
+                return model, None
+            return model, max(rss_after - rss_before, 0)
+
+        def _init():
+            memo_key = (device, compute_type)
             try:
-                return WhisperModel(
+                failed_at = _FAILED_DEVICES.get(memo_key)
+                if failed_at is not None:
+                    if time.monotonic() - failed_at < _FAILED_DEVICE_TTL:
+                        raise RuntimeError(f"{device} init failed recently in this process")
+                    _FAILED_DEVICES.pop(memo_key, None)
+                if device == "cuda":
+                    for name, value in _CT2_CUDA_ENV.items():
+                        os.environ.setdefault(name, value)
+                return _whisper().WhisperModel(
                     model_id,
                     device=device,
                     compute_type=compute_type,
+                    cpu_threads=cpu_threads,
                     download_root=str(self.model_manager.models_dir),
+                    local_files_only=local,
                 )
             except Exception as e:
                 if device != "cpu":
+                    message = str(e)
+                    if (
+                        isinstance(e, (RuntimeError, OSError))
+                        and _DEVICE_ERROR_RE.search(message)
+                        and 'out of memory' not in message.lower()
+                    ):
+                        _FAILED_DEVICES.setdefault(memo_key, time.monotonic())
                     logger.warning(f"GPU init failed, falling back to CPU: {e}")
-                    return WhisperModel(
+                    return _whisper().WhisperModel(
                         model_id,
                         device="cpu",
                         compute_type="int8",
+                        cpu_threads=cpu_threads,
                         download_root=str(self.model_manager.models_dir),
+                        local_files_only=local,
                     )
                 raise
 
-        model = await loop.run_in_executor(self._executor, _load)
+        model, measured_bytes = await loop.run_in_executor(self._io_executor, _load)
 
         estimated_bytes = self.model_manager.AVAILABLE_MODELS.get(
             model_name, 0
         )
-        self._model_cache.put(cache_key, model, estimated_bytes)
+        if measured_bytes is None:
+            weight = estimated_bytes
+        elif device == "cpu":
+            weight = measured_bytes or estimated_bytes
+        else:
+            # GPU weights barely show up in host RSS.
+            weight = max(measured_bytes, estimated_bytes)
+        self._model_cache.put(cache_key, model, weight)
         return model
 
-    def _get_audio_duration(self, audio_path: str) -> float:
-        """
-        Get duration of audio file in seconds.
-        
-        Args:
-            audio_path: Path to audio file
-            
-        Returns:
-            Duration in seconds, or 0 if unable to determine
+    def _batch_size(self, model_name: str, device: str) -> int:
+        """Pick how many audio chunks to decode per batch.
+
+        On CUDA the batch is sized from free device memory, allowing
+        roughly a quarter of the model's weight size per chunk.
         """
-        try:
-            import subprocess
-            import json
-            
-            # Use ffprobe to get duration
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                audio_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                duration = float(data.get('format', {}).get('duration', 0))
-                logger.debug(f"Audio duration: {duration:.2f} seconds")
-                return duration
-                
-        except Exception as e:
-            logger.warning(f"Could not determine audio duration: {e}")
-            
-        return 0.0
-    
+        if _BATCH_SIZE_OVERRIDE > 0:
+            return _BATCH_SIZE_OVERRIDE
+        if device == "cpu":
+            return _CPU_BATCH_SIZE
+        free_bytes = get_free_gpu_memory()
+        if free_bytes is None:
+            return _CPU_BATCH_SIZE
+        per_chunk = max(
+            self.model_manager.AVAILABLE_MODELS.get(model_name, 0) // 4,
+            64 * 1024 * 1024,
+        )
+        return max(1, min(_MAX_GPU_BATCH_SIZE, free_bytes // per_chunk))
+
+    async def close(self):
+        """Release the HTTP client and worker threads."""
+        if self._idle_eviction is not None:
+            self._idle_eviction.cancel()
+        await self._http.aclose()
+        self._compute_executor.shutdown(wait=False, cancel_futures=True)
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+
     async def cancel_job(self, job_id: str) -> bool:
         """
         Cancel an active transcription job.
@@ -431,9 +1014,13 @@ class TranscriptionEngine:
         Returns:
             True if job was active and cancelled, False otherwise
         """
-        if job_id in self.active_jobs:
+        cancel_event = self.active_jobs.get(job_id)
+        if cancel_event is not None:
             logger.info(f"Cancelling job {job_id}")
-            self.active_jobs[job_id] = False
+            cancel_event.set()
+            segment_queue = self._segment_queues.get(job_id)
+            if segment_queue is not None:
+                segment_queue.put_nowait(None)
             await self.db.cancel_job(job_id)
             return True
         return False
\ No newline at end of file
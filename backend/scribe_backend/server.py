@@ -7,6 +7,7 @@ import signal
 
 import grpc
 import coloredlogs
+from google.protobuf.internal import api_implementation
 
 from scribe_backend.proto import scribe_pb2_grpc
 from scribe_backend.service import ScribeService
@@ -36,6 +37,14 @@ async def serve(port: int = _DEFAULT_PORT):
     )
     
     logger.info("Starting Scribe backend server...")
+
+    # Streams build and serialize a message per event; the pure-Python
+    # protobuf fallback is several times slower than the upb extension.
+    if api_implementation.Type() == 'python':
+        logger.warning(
+            "protobuf is using its pure-Python implementation; "
+            "message handling will be slow"
+        )
     
     # Create server
     server = grpc.aio.server(
@@ -46,6 +55,18 @@ async def serve(port: int = _DEFAULT_PORT):
             ('grpc.keepalive_timeout_ms', 10_000),  # Wait 10s for ping ack
             ('grpc.keepalive_permit_without_calls', 1),  # Allow pings with no active RPCs
             ('grpc.http2.min_ping_interval_without_data_ms', 30_000),
+            # Keep pinging during long quiet stretches of a stream (e.g. a
+            # large model loading) instead of stopping after two pings.
+            ('grpc.http2.max_pings_without_data', 0),
+            # Larger frames for big GetTranscript responses over loopback.
+            ('grpc.http2.max_frame_size', 1024 * 1024),
+            # Well above the stream subscribers plus unary calls a client
+            # keeps open on its single connection; only a runaway bound.
+            ('grpc.max_concurrent_streams', 1000),
+            ('grpc.optimization_target', 'throughput'),
+            # Jobs, subscribers and downloads live in this process, so a
+            # second backend must fail to bind rather than share the port.
+            ('grpc.so_reuseport', 0),
         ]
     )
     
@@ -102,6 +123,7 @@ async def serve(port: int = _DEFAULT_PORT):
         for sig in registered_signals:
             loop.remove_signal_handler(sig)
         await server.stop(5)
+        await service.engine.close()
         service.db.close()
         logger.info("Server stopped")
 
@@ -109,8 +131,15 @@ async def serve(port: int = _DEFAULT_PORT):
 def main():
     """Main entry point"""
     args = _parse_args()
+    # uvloop's libuv reactor is cheaper per socket wakeup than the stdlib
+    # loop; it isn't available on Windows.
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
     try:
-        asyncio.run(serve(port=args.port))
+        run(serve(port=args.port))
     except KeyboardInterrupt:
         # asyncio.run() may still raise KeyboardInterrupt after task cancellation.
         # Treat Ctrl+C as normal shutdown to avoid noisy traceback output.
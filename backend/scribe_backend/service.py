@@ -1,11 +1,13 @@
 """gRPC Service implementation for Scribe"""
 
 import asyncio
+import collections
 import functools
 import logging
 import os
+import re
 from pathlib import Path
-from typing import AsyncIterator, Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 import grpc
 
@@ -26,34 +28,104 @@ _BLOCKED_PREFIXES = (
     '/etc', '/proc', '/sys', '/dev',
     '/boot', '/sbin', '/bin', '/lib',
 )
+# One match against any blocked prefix, as the directory itself or a path
+# beneath it.
+_BLOCKED_RE = re.compile(
+    f"(?:{'|'.join(map(re.escape, _BLOCKED_PREFIXES))})(?:{re.escape(os.sep)}|$)"
+)
 
 
-def _validate_audio_path(raw_path: str) -> Tuple[Optional[str], Optional[str]]:
-    """Sanitise and validate a user-supplied audio file path.
+# Job states after which no further events are published.
+_TERMINAL_STATUSES = frozenset((
+    scribe_pb2.JobStatus.COMPLETED,
+    scribe_pb2.JobStatus.FAILED,
+    scribe_pb2.JobStatus.CANCELED,
+))
 
-    Returns:
-        (resolved_path, None) on success, or (None, error_message) on failure.
+# Seconds a successful health check is reused before the DB is pinged again.
+_HEALTH_CHECK_TTL = 2.0
+
+# Recent events kept per streamed job.  A subscriber that falls further
+# behind than this skips ahead to the oldest event still buffered.
+_EVENT_BUFFER_SIZE = 1024
+
+
+class _EventLog:
+    """Recent events of one job, shared by all of its stream subscribers.
+
+    Events are appended to a bounded buffer and numbered from 0; each
+    subscriber keeps its own cursor (the number of the next event it wants)
+    and waits on ``changed`` when it has caught up.  ``changed`` is set and
+    immediately cleared on every append, which wakes everyone waiting.
+    None marks the end of the stream.
+    """
+
+    __slots__ = ('events', 'end', 'changed', 'subscribers')
+
+    def __init__(self):
+        self.events: collections.deque = collections.deque(maxlen=_EVENT_BUFFER_SIZE)
+        self.end = 0  # number of the next event to be appended
+        self.changed = asyncio.Event()
+        self.subscribers = 0
+
+    def append(self, event: Optional[scribe_pb2.TranscriptionEvent]):
+        self.events.append(event)
+        self.end += 1
+        self.changed.set()
+        self.changed.clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_path_string(raw_path: str) -> Optional[str]:
+    """Run the validation that depends only on the path string.
+
+    Cached per raw path.  Returns an error message, or None if the string
+    is acceptable.
     """
     if not raw_path or not raw_path.strip():
-        return None, "Audio file path is empty"
+        return "Audio file path is empty"
 
     # Require an absolute path — relative paths are ambiguous.
     if not os.path.isabs(raw_path):
-        return None, "Audio file path must be absolute"
+        return "Audio file path must be absolute"
+
+    return _check_extension(raw_path)
+
+
+def _check_extension(path: str) -> Optional[str]:
+    """Return an error message if path's extension is not allowed."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _ALLOWED_EXTENSIONS:
+        allowed = ', '.join(sorted(_ALLOWED_EXTENSIONS))
+        return f"Unsupported file type '{ext}'. Allowed: {allowed}"
+    return None
+
+
+def _validate_audio_path(raw_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Sanitise and validate a user-supplied audio file path.
+
+    The string checks are cached; resolving symlinks, the system-directory
+    check and the regular-file check depend on the filesystem and run on
+    every call.  Blocking — call it off the event loop.
+
+    Returns:
+        (resolved_path, None) on success, or (None, error_message) on failure.
+    """
+    error = _check_path_string(raw_path)
+    if error:
+        return None, error
 
     # Resolve '..' / symlinks to a canonical path to prevent traversal.
     resolved = str(Path(raw_path).resolve())
 
     # Block access to sensitive system directories.
-    for prefix in _BLOCKED_PREFIXES:
-        if resolved == prefix or resolved.startswith(prefix + os.sep):
-            return None, f"Access denied: path is inside a system directory"
+    if _BLOCKED_RE.match(resolved):
+        return None, f"Access denied: path is inside a system directory"
 
-    # Check file extension.
-    ext = Path(resolved).suffix.lower()
-    if ext not in _ALLOWED_EXTENSIONS:
-        allowed = ', '.join(sorted(_ALLOWED_EXTENSIONS))
-        return None, f"Unsupported file type '{ext}'. Allowed: {allowed}"
+    # A symlink may point at a file with a different extension.
+    error = _check_extension(resolved)
+    if error:
+        return None, error
 
     # Must be a regular file (not a directory, device node, etc.).
     if not os.path.isfile(resolved):
@@ -70,9 +142,14 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
         self.db = Database()
         self.model_manager = ModelManager()
         self.engine = TranscriptionEngine(self.db, self.model_manager)
+        # Strong references to running background tasks: the event loop
+        # only keeps weak ones, so an unreferenced task can be collected
+        # mid-run.  Entries remove themselves when the task finishes.
         self._background_tasks: set[asyncio.Task] = set()
-        # Event-driven streaming: job_id -> list of subscriber queues
-        self._job_subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # Event-driven streaming: job_id -> event log read by its subscribers
+        self._job_subscribers: Dict[str, _EventLog] = {}
+        # Loop time of the last successful health check.
+        self._healthy_at = float('-inf')
 
     async def start(self):
         """Start background tasks. Must be called after the event loop is running."""
@@ -83,40 +160,82 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
                 f"(marked as FAILED)"
             )
 
-    def _subscribe(self, job_id: str) -> asyncio.Queue:
-        """Add a subscriber queue for a job's events."""
-        queue = asyncio.Queue()
-        self._job_subscribers.setdefault(job_id, []).append(queue)
-        return queue
+        # Load the last-used model in the background so the first job
+        # doesn't wait for it.
+        self._spawn(self.engine.warm_up())
 
-    def _unsubscribe(self, job_id: str, queue: asyncio.Queue):
-        """Remove a subscriber queue and clean up if no subscribers remain."""
-        subs = self._job_subscribers.get(job_id)
-        if subs:
-            try:
-                subs.remove(queue)
-            except ValueError:
-                pass
-            if not subs:
-                del self._job_subscribers[job_id]
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine as a tracked background task."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _subscribe(self, job_id: str) -> _EventLog:
+        """Register a subscriber and return the job's event log."""
+        log = self._job_subscribers.get(job_id)
+        if log is None:
+            log = self._job_subscribers[job_id] = _EventLog()
+        log.subscribers += 1
+        return log
+
+    def _unsubscribe(self, job_id: str, log: _EventLog):
+        """Drop a subscriber and the job's log once no subscribers remain."""
+        log.subscribers -= 1
+        if not log.subscribers and self._job_subscribers.get(job_id) is log:
+            del self._job_subscribers[job_id]
 
     def _publish(self, job_id: str, event: scribe_pb2.TranscriptionEvent):
-        """Push an event to all subscribers of a job. None signals end-of-stream."""
-        for queue in self._job_subscribers.get(job_id, []):
-            queue.put_nowait(event)
+        """Append an event for a job's subscribers. None signals end-of-stream.
+
+        Every subscriber reads the same message object from the job's log;
+        nothing is copied or queued per subscriber.
+        """
+        log = self._job_subscribers.get(job_id)
+        if log is not None:
+            log.append(event)
+
+    def _on_engine_event(self, job_id: str, event: dict):
+        """Convert an engine event to protobuf and publish it to subscribers."""
+        proto_event = scribe_pb2.TranscriptionEvent(
+            job_id=job_id,
+            status=event['status'],
+            progress=event.get('progress', 0.0),
+        )
+        if event.get('error'):
+            proto_event.error = event['error']
+        seg = event.get('segment')
+        if seg:
+            # Filled in place; no intermediate Segment to copy from.
+            segment = proto_event.segment
+            segment.index = seg['idx']
+            segment.start = seg['start']
+            segment.end = seg['end']
+            segment.text = seg['text']
+        self._publish(job_id, proto_event)
+        if event.get('final'):
+            self._publish_end(job_id)
 
     def _publish_end(self, job_id: str):
         """Signal all subscribers that no more events will be sent."""
-        for queue in self._job_subscribers.get(job_id, []):
-            queue.put_nowait(None)
+        self._publish(job_id, None)
 
     async def HealthCheck(self, request, context):
         """Check if the service is healthy"""
-        logger.info("Health check requested")
-        
+        logger.debug("Health check requested")
+
+        # A recent success is reused; failures are always re-checked.
+        now = asyncio.get_running_loop().time()
+        if now - self._healthy_at < _HEALTH_CHECK_TTL:
+            return scribe_pb2.HealthCheckResponse(
+                ok=True,
+                message="Service is healthy"
+            )
+
         # Check if database is accessible
         try:
-            await self.db.get_all_settings()
+            await self.db.ping()
+            self._healthy_at = now
             return scribe_pb2.HealthCheckResponse(
                 ok=True,
                 message="Service is healthy"
@@ -140,26 +259,29 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
             )
             return
 
-        audio_path, error = _validate_audio_path(request.audio.file_path)
+        audio_path, error = await asyncio.get_running_loop().run_in_executor(
+            None, _validate_audio_path, request.audio.file_path
+        )
         if error:
             await context.abort(grpc.StatusCode.INVALID_ARGUMENT, error)
             return
 
         # Generate job ID if not provided
-        job_id = request.job_id if request.job_id else await self.db.new_job_id()
+        job_id = request.job_id if request.job_id else self.db.new_job_id()
         
-        # Get transcription options
-        options = request.options if request.HasField('options') else None
-        model_name = options.model if options and options.model else "base"
-        language = options.language if options and options.language else None
-        translate = options.translate_to_english if options else False
+        # Get transcription options.  An unset message field reads as the
+        # default instance, so only enable_gpu (default True) needs HasField.
+        options = request.options
+        model_name = options.model or "base"
+        language = options.language or None
+        translate = options.translate_to_english
         translate_to_language = (
             options.translate_to_language.lower()
-            if options and options.translate_to_language
-            else ("en" if translate else None)
+            or ("en" if translate else None)
         )
-        initial_prompt = options.initial_prompt if options and options.initial_prompt else None
-        enable_gpu = options.enable_gpu if options else True
+        initial_prompt = options.initial_prompt or None
+        enable_gpu = options.enable_gpu if request.HasField('options') else True
+        compute_type = options.compute_type or self.engine.default_compute_type()
         
         # Create job in database
         success = await self.db.create_job(
@@ -177,30 +299,8 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
             )
             return
 
-        # Build event callback that converts engine events to protobuf
-        # and publishes them to all stream subscribers.
-        def _on_engine_event(jid: str, event: dict):
-            proto_event = scribe_pb2.TranscriptionEvent(
-                job_id=jid,
-                status=event['status'],
-                progress=event.get('progress', 0.0),
-            )
-            if event.get('error'):
-                proto_event.error = event['error']
-            seg = event.get('segment')
-            if seg:
-                proto_event.segment.CopyFrom(scribe_pb2.Segment(
-                    index=seg['idx'],
-                    start=seg['start'],
-                    end=seg['end'],
-                    text=seg['text'],
-                ))
-            self._publish(jid, proto_event)
-            if event.get('final'):
-                self._publish_end(jid)
-
         # Start transcription in background
-        task = asyncio.create_task(
+        self._spawn(
             self.engine.run_job(
                 job_id=job_id,
                 audio_path=audio_path,
@@ -210,12 +310,10 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
                 translate_to_language=translate_to_language,
                 initial_prompt=initial_prompt,
                 enable_gpu=enable_gpu,
-                on_event=_on_engine_event,
+                compute_type=None if compute_type == 'auto' else compute_type,
+                on_event=self._on_engine_event,
             )
         )
-        self._background_tasks.add(task)
-        task.add_done_callback(self._background_tasks.discard)
-        task.add_done_callback(self._on_task_done)
         
         return scribe_pb2.StartTranscriptionResponse(
             job_id=job_id,
@@ -238,26 +336,27 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
 
         # If the job already finished before the client subscribed, replay
         # the final state from the DB and return immediately.
-        terminal_statuses = [
-            scribe_pb2.JobStatus.COMPLETED,
-            scribe_pb2.JobStatus.FAILED,
-            scribe_pb2.JobStatus.CANCELED,
-        ]
-        if job['status'] in terminal_statuses:
-            # Replay all segments then the terminal event
-            segments = await self.db.get_segments(job_id)
-            for seg in segments:
-                yield scribe_pb2.TranscriptionEvent(
-                    job_id=job_id,
-                    status=job['status'],
-                    progress=job.get('progress', 0.0),
-                    segment=scribe_pb2.Segment(
-                        index=seg['idx'],
-                        start=seg['start'],
-                        end=seg['end'],
-                        text=seg['text'],
-                    ),
-                )
+        if job['status'] in _TERMINAL_STATUSES:
+            # Replay all segments then the terminal event.  Segments are
+            # streamed from the DB in batches so long transcripts are never
+            # held in memory all at once.
+            #
+            # One event is reused for every segment: gRPC serializes each
+            # yielded message before resuming the generator, so only the
+            # segment fields need rewriting between yields.
+            event = scribe_pb2.TranscriptionEvent(
+                job_id=job_id,
+                status=job['status'],
+                progress=job.get('progress', 0.0),
+            )
+            segment = event.segment
+            async for batch in self.db.iter_segments(job_id):
+                for seg in batch:
+                    segment.index = seg['idx']
+                    segment.start = seg['start']
+                    segment.end = seg['end']
+                    segment.text = seg['text']
+                    yield event
             final = scribe_pb2.TranscriptionEvent(
                 job_id=job_id,
                 status=job['status'],
@@ -269,16 +368,59 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
             return
 
         # Subscribe to live events
-        queue = self._subscribe(job_id)
+        log = self._subscribe(job_id)
+        cursor = log.end
+        # Highest segment index and latest progress sent to this client.
+        last_idx = -1
+        progress = job.get('progress', 0.0)
         try:
             while True:
-                event = await queue.get()
+                if cursor == log.end:
+                    await log.changed.wait()
+                    continue
+                first = log.end - len(log.events)
+                if cursor < first:
+                    # Events aged out of the buffer before this client read
+                    # them.  Segments are written to the DB before the job
+                    # can get a buffer's length ahead of the writer, so the
+                    # missed ones are sent from there; progress-only events
+                    # are superseded anyway.
+                    logger.warning(
+                        f"Stream for job {job_id} fell behind, "
+                        f"backfilling {first - cursor} event(s) from the database"
+                    )
+                    async for batch in self.db.iter_segments(job_id, last_idx):
+                        for seg in batch:
+                            event = scribe_pb2.TranscriptionEvent(
+                                job_id=job_id,
+                                status=scribe_pb2.JobStatus.RUNNING,
+                                progress=progress,
+                            )
+                            segment = event.segment
+                            segment.index = seg['idx']
+                            segment.start = seg['start']
+                            segment.end = seg['end']
+                            segment.text = seg['text']
+                            last_idx = seg['idx']
+                            yield event
+                    # Anything that aged out during the backfill is caught
+                    # by the next pass, which resumes after last_idx.
+                    cursor = first
+                    continue
+                event = log.events[cursor - first]
+                cursor += 1
                 if event is None:
                     # End-of-stream sentinel
                     break
+                if event.HasField('segment'):
+                    if event.segment.index <= last_idx:
+                        # Already sent by a backfill.
+                        continue
+                    last_idx = event.segment.index
+                progress = event.progress
                 yield event
         finally:
-            self._unsubscribe(job_id, queue)
+            self._unsubscribe(job_id, log)
     
     async def GetJob(self, request, context):
         """Get information about a specific job"""
@@ -323,17 +465,14 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
     
     async def CancelJob(self, request, context):
         """Cancel a running job"""
-        # Try to cancel in engine first
-        cancelled = await self.engine.cancel_job(request.job_id)
-        
-        if not cancelled:
-            # Job might not be running, update status in DB
-            job = await self.db.get_job(request.job_id)
-            if job and job['status'] in [scribe_pb2.JobStatus.QUEUED, scribe_pb2.JobStatus.RUNNING]:
-                await self.db.cancel_job(request.job_id)
-                cancelled = True
-        
-        return scribe_pb2.CancelJobResponse(canceled=cancelled)
+        # Stop the job in the engine if it is running there, and cancel its
+        # row if it is still active (e.g. queued, or orphaned); either
+        # counts as a cancellation.
+        results = await asyncio.gather(
+            self.engine.cancel_job(request.job_id),
+            self.db.cancel_job_if_active(request.job_id),
+        )
+        return scribe_pb2.CancelJobResponse(canceled=any(results))
     
     async def DeleteJob(self, request, context):
         """Delete a job and its data"""
@@ -353,26 +492,26 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
 
         segments = await self.db.get_segments(request.job_id)
 
-        proto_segments = [
-            scribe_pb2.Segment(
-                index=seg['idx'],
-                start=seg['start'],
-                end=seg['end'],
-                text=seg['text'],
-                edited_text=seg.get('edited_text') or ''
-            )
-            for seg in segments
-        ]
-
-        return scribe_pb2.GetTranscriptResponse(
+        response = scribe_pb2.GetTranscriptResponse(
             job_id=job['job_id'],
             status=job['status'],
-            segments=proto_segments,
             audio_path=job.get('audio_path', ''),
             model=job.get('model', ''),
             language=job.get('language', ''),
             created_at=job.get('created_at', '')
         )
+        # Segments are built in place in the repeated field rather than
+        # constructed separately and copied in.
+        add_segment = response.segments.add
+        for seg in segments:
+            segment = add_segment()
+            segment.index = seg['idx']
+            segment.start = seg['start']
+            segment.end = seg['end']
+            segment.text = seg['text']
+            segment.edited_text = seg['edited_text']
+
+        return response
 
     async def SaveTranscriptEdits(self, request, context):
         """Persist user edits to transcript segments"""
@@ -400,11 +539,11 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
 
     async def GetSettings(self, request, context):
         """Get application settings"""
-        settings = await self.db.get_all_settings()
+        settings = self.db.get_all_settings()
         
         # Get defaults if not set
         models_dir = settings.get('models_dir', str(self.model_manager.models_dir))
-        prefer_gpu = settings.get('prefer_gpu', 'true').lower() == 'true'
+        prefer_gpu = self.db.get_bool_setting('prefer_gpu', True)
         default_model = settings.get('default_model', 'base')
         compute_type = settings.get('compute_type', 'auto')
         
@@ -420,28 +559,40 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
     async def UpdateSettings(self, request, context):
         """Update application settings"""
         settings = request.settings
-        
-        # Save settings to database
+        current = self.db.get_all_settings()
+
+        # Save changed settings to database; clients resend the whole
+        # form, so unchanged values are skipped rather than rewritten.
+        updates = {'prefer_gpu': str(settings.prefer_gpu).lower()}
         if settings.models_dir:
-            await self.db.set_setting('models_dir', settings.models_dir)
-            # Update model manager and propagate to engine
-            self.model_manager = ModelManager(settings.models_dir)
-            self.engine.model_manager = self.model_manager
-            
-        await self.db.set_setting('prefer_gpu', str(settings.prefer_gpu).lower())
-        
+            updates['models_dir'] = settings.models_dir
         if settings.default_model:
-            await self.db.set_setting('default_model', settings.default_model)
-            
+            updates['default_model'] = settings.default_model
         if settings.compute_type:
-            await self.db.set_setting('compute_type', settings.compute_type)
-        
+            updates['compute_type'] = settings.compute_type
+
+        for key, value in updates.items():
+            if current.get(key) != value:
+                await self.db.set_setting(key, value)
+
+        # Swap the model manager only when the directory actually moves;
+        # a new manager forgets in-flight downloads and its scan cache.
+        if (
+            settings.models_dir
+            and Path(settings.models_dir) != self.model_manager.models_dir
+        ):
+            self.model_manager = ModelManager(settings.models_dir)
+            self.engine.model_manager = self.model_manager
+
         # Return updated settings
         return await self.GetSettings(request, context)
     
     async def ListModels(self, request, context):
         """List available Whisper models"""
-        models = self.model_manager.list_available_models()
+        # Scanning the models directory is blocking disk I/O.
+        models = await asyncio.get_running_loop().run_in_executor(
+            None, self.model_manager.list_available_models
+        )
         
         response = scribe_pb2.ListModelsResponse()
         for model in models:
@@ -466,7 +617,10 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
             return
 
         # Check if already downloaded
-        if self.model_manager.is_model_downloaded(model_name):
+        # May rescan the models directory; keep it off the event loop.
+        if await asyncio.get_running_loop().run_in_executor(
+            None, self.model_manager.is_model_downloaded, model_name
+        ):
             logger.info(f"Model {model_name} already downloaded")
             size = self.model_manager.AVAILABLE_MODELS[model_name]
             yield scribe_pb2.DownloadModelProgress(
@@ -484,12 +638,19 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
         )
 
         loop = asyncio.get_running_loop()
-        queue: asyncio.Queue = asyncio.Queue()
+        # Only the newest (downloaded, total) pair matters, so progress is
+        # kept in a single slot; `wake` is set on new progress and when the
+        # download finishes.
+        latest: Optional[Tuple[int, int]] = None
+        wake = asyncio.Event()
+
+        def _set_progress(progress: Tuple[int, int]):
+            nonlocal latest
+            latest = progress
+            wake.set()
 
         def progress_callback(downloaded: int, total: int):
-            loop.call_soon_threadsafe(
-                queue.put_nowait, (downloaded, total)
-            )
+            loop.call_soon_threadsafe(_set_progress, (downloaded, total))
 
         from .engine.model_manager import DownloadCanceled
 
@@ -501,38 +662,25 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
                 progress_callback,
             ),
         )
+        # Progress callbacks queued before completion run before this one,
+        # so the last progress is already in `latest` when it fires.
+        download_future.add_done_callback(lambda _: wake.set())
 
         try:
             # Yield progress events until the download finishes
             while True:
-                # Wait for either a progress update or the download to finish
-                get_task = asyncio.ensure_future(queue.get())
-                done, _ = await asyncio.wait(
-                    [get_task, download_future],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-
-                if get_task in done:
-                    downloaded, total = get_task.result()
+                await wake.wait()
+                wake.clear()
+                if latest is not None:
+                    downloaded, total = latest
+                    latest = None
                     yield scribe_pb2.DownloadModelProgress(
                         name=model_name,
                         status=scribe_pb2.DOWNLOAD_DOWNLOADING,
                         downloaded_bytes=downloaded,
                         total_bytes=total,
                     )
-                else:
-                    get_task.cancel()
-
                 if download_future.done():
-                    # Drain any remaining progress events
-                    while not queue.empty():
-                        downloaded, total = queue.get_nowait()
-                        yield scribe_pb2.DownloadModelProgress(
-                            name=model_name,
-                            status=scribe_pb2.DOWNLOAD_DOWNLOADING,
-                            downloaded_bytes=downloaded,
-                            total_bytes=total,
-                        )
                     break
 
             # Check download result
@@ -574,18 +722,20 @@ class ScribeService(scribe_pb2_grpc.ScribeServicer):
 
     async def DeleteModel(self, request, context):
         """Delete a downloaded model"""
-        deleted = self.model_manager.delete_model(request.name)
+        deleted = await asyncio.get_running_loop().run_in_executor(
+            None, self.model_manager.delete_model, request.name
+        )
         
         return scribe_pb2.DeleteModelResponse(
             name=request.name,
             deleted=deleted
         )
     
-    @staticmethod
-    def _on_task_done(task: asyncio.Task):
-        """Log unhandled exceptions from background transcription tasks."""
+    def _on_task_done(self, task: asyncio.Task):
+        """Forget a finished background task and log any unhandled exception."""
+        self._background_tasks.discard(task)
         if task.cancelled():
             return
         exc = task.exception()
         if exc is not None:
-            logger.error(f"Background transcription task failed: {exc}", exc_info=exc)
\ No newline at end of file
+            logger.error(f"Background task failed: {exc}", exc_info=exc)
\ No newline at end of file
@@ -13,15 +13,17 @@ Expected output:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import os
 import shlex
 import shutil
 import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import which
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -32,6 +34,19 @@ PROTO_DIR = PROJECT_ROOT / "proto"
 PROTO_FILE = PROTO_DIR / "scribe.proto"
 PY_PROTO_OUT = BACKEND_DIR / "scribe_backend" / "proto"
 DART_PROTO_OUT = FRONTEND_APP_DIR / "lib" / "proto"
+PYINSTALLER_CACHE_DIR = Path(
+    os.environ.get("SCRIBE_PYINSTALLER_CACHE")
+    or Path.home() / ".cache" / "scribe" / "pyinstaller"
+)
+
+
+# Files whose contents are already compressed; deflating them again costs
+# time for no size gain. The PyInstaller onefile backend embeds a
+# zlib-compressed archive, so it is matched by name.
+STORED_SUFFIXES = frozenset(
+    {".zip", ".gz", ".xz", ".bz2", ".7z", ".png", ".jpg", ".jpeg", ".webp"}
+)
+STORED_NAMES = frozenset({"scribe_backend", "scribe_backend.exe"})
 
 
 class BuildError(RuntimeError):
@@ -158,15 +173,32 @@ def ensure_release_venv(platform: str) -> Path:
     return python
 
 
+def pyinstaller_cache_key(python: Path, options: list[str]) -> str:
+    """Hash everything that invalidates PyInstaller's analysis wholesale.
+
+    Backend source edits are not part of the key: PyInstaller re-analyzes
+    changed modules itself when its workpath is reused.
+    """
+    version = subprocess.run(
+        [str(python), "-m", "PyInstaller", "--version"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    digest = hashlib.sha256()
+    digest.update((BACKEND_DIR / "requirements.txt").read_bytes())
+    digest.update(PROTO_FILE.read_bytes())
+    digest.update(version.encode())
+    digest.update("\0".join(options).encode())
+    return digest.hexdigest()[:16]
+
+
 def build_backend_binary(platform: str, python: Path) -> Path:
     log("Building backend executable with PyInstaller")
 
     backend_dist_dir = BACKEND_DIR / "dist"
-    backend_work_dir = BACKEND_DIR / "build_pyinstaller"
     backend_spec = BACKEND_DIR / "scribe_backend.spec"
 
-    if backend_work_dir.exists():
-        shutil.rmtree(backend_work_dir)
     if backend_spec.exists():
         backend_spec.unlink()
 
@@ -189,14 +221,10 @@ def build_backend_binary(platform: str, python: Path) -> Path:
         f"{data_separator}scribe_backend/db"
     )
 
-    cmd = [
-        str(python),
-        "-m",
-        "PyInstaller",
+    options = [
         "--name",
         "scribe_backend",
         "--noconfirm",
-        "--clean",
         "--onefile",
         "--add-data",
         proto_data,
@@ -212,6 +240,31 @@ def build_backend_binary(platform: str, python: Path) -> Path:
         "faster_whisper",
         "--hidden-import",
         "coloredlogs",
+        # protobuf loads its upb backend dynamically and silently falls
+        # back to pure Python when it is missing from the bundle.
+        "--hidden-import",
+        "google._upb._message",
+    ]
+
+    # Reuse the analysis workpath while requirements, proto, PyInstaller
+    # version and options are unchanged; otherwise start clean and drop
+    # workpaths left by older keys.
+    cache_key = pyinstaller_cache_key(python, options)
+    backend_work_dir = PYINSTALLER_CACHE_DIR / cache_key
+    if backend_work_dir.is_dir():
+        log(f"Reusing PyInstaller workpath {backend_work_dir}")
+    else:
+        if PYINSTALLER_CACHE_DIR.is_dir():
+            for stale in PYINSTALLER_CACHE_DIR.iterdir():
+                if stale.is_dir():
+                    shutil.rmtree(stale)
+        options.append("--clean")
+
+    cmd = [
+        str(python),
+        "-m",
+        "PyInstaller",
+        *options,
         "--distpath",
         str(backend_dist_dir),
         "--workpath",
@@ -362,17 +415,38 @@ def place_backend_binary(
         target.chmod(target.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
 
+def iter_files(root: Path):
+    """Yield the path of every non-directory entry under root.
+
+    Uses os.scandir so directory checks come from the cached dirent type
+    instead of a stat per path.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif not entry.is_dir():
+                    yield entry.path
+
+
 def create_zip(source_dir: Path, archive_path: Path) -> None:
     if archive_path.exists():
         archive_path.unlink()
 
     root_for_archive = source_dir.parent
     with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as zipf:
-        for item in sorted(source_dir.rglob("*")):
-            if item.is_dir():
-                continue
+        for path in sorted(iter_files(source_dir)):
+            item = Path(path)
             arcname = item.relative_to(root_for_archive)
-            zipf.write(item, arcname=arcname)
+            compress_type = (
+                ZIP_STORED
+                if item.name in STORED_NAMES
+                or item.suffix.lower() in STORED_SUFFIXES
+                else ZIP_DEFLATED
+            )
+            zipf.write(path, arcname=arcname, compress_type=compress_type)
 
 
 def create_archive(platform: str, source_dir: Path, archive_path: Path) -> None:
@@ -409,8 +483,13 @@ def package_release(platform: str, version: str) -> Path:
 
     python = ensure_release_venv(platform)
     generate_proto_stubs(python)
-    backend_exe = build_backend_binary(platform, python)
-    build_frontend(platform)
+    # The backend and frontend builds only share the generated stubs, so
+    # run the two toolchains side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend_future = executor.submit(build_backend_binary, platform, python)
+        frontend_future = executor.submit(build_frontend, platform)
+        backend_exe = backend_future.result()
+        frontend_future.result()
     macos_app_bundle = copy_frontend_bundle(platform, staging_dir)
     place_backend_binary(platform, staging_dir, backend_exe, macos_app_bundle)
     create_archive(platform, staging_dir, archive_path)
@@ -0,0 +1,30 @@
+"""Shared path setup and import helpers for the test scripts"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Add project/backend roots to path for runtime and type checking
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+
+for p in (PROJECT_ROOT, BACKEND_ROOT):
+    p_str = str(p)
+    if p_str not in sys.path:
+        sys.path.insert(0, p_str)
+
+
+def find_package(candidates):
+    """Return the first importable module name among candidates, or None.
+
+    Probing with find_spec keeps real import errors inside the backend
+    (e.g. a missing dependency) from being mistaken for a wrong prefix.
+    """
+    for name in candidates:
+        try:
+            if importlib.util.find_spec(name) is not None:
+                return name
+        except ModuleNotFoundError:
+            # Parent package of this candidate does not exist.
+            continue
+    return None
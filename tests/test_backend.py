@@ -3,43 +3,29 @@
 
 import asyncio
 import logging
-import sys
-from pathlib import Path
 
-# Add project/backend roots to path for runtime and type checking
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-BACKEND_ROOT = PROJECT_ROOT / "backend"
+from _bootstrap import find_package
 
-for p in (PROJECT_ROOT, BACKEND_ROOT):
-    p_str = str(p)
-    if p_str not in sys.path:
-        sys.path.insert(0, p_str)
 
 def _load_backend_symbols():
     import importlib
 
-    candidates = ("backend.scribe_backend", "scribe_backend")
-    last_error = None
-
-    for base in candidates:
-        try:
-            dao_mod = importlib.import_module(f"{base}.db.dao")
-            gpu_mod = importlib.import_module(f"{base}.engine.gpu")
-            mm_mod = importlib.import_module(f"{base}.engine.model_manager")
-            return (
-                dao_mod.Database,
-                gpu_mod.detect_gpu,
-                gpu_mod.get_device,
-                gpu_mod.get_compute_type,
-                mm_mod.ModelManager,
-            )
-        except ModuleNotFoundError as e:
-            last_error = e
-            continue
+    base = find_package(("backend.scribe_backend", "scribe_backend"))
+    if base is None:
+        raise ModuleNotFoundError(
+            "Could not import backend modules from either 'backend.scribe_backend' or 'scribe_backend'"
+        )
 
-    raise ModuleNotFoundError(
-        "Could not import backend modules from either 'backend.scribe_backend' or 'scribe_backend'"
-    ) from last_error
+    dao_mod = importlib.import_module(f"{base}.db.dao")
+    gpu_mod = importlib.import_module(f"{base}.engine.gpu")
+    mm_mod = importlib.import_module(f"{base}.engine.model_manager")
+    return (
+        dao_mod.Database,
+        gpu_mod.detect_gpu,
+        gpu_mod.get_device,
+        gpu_mod.get_compute_type,
+        mm_mod.ModelManager,
+    )
 
 
 Database, detect_gpu, get_device, get_compute_type, ModelManager = _load_backend_symbols()
@@ -63,12 +49,12 @@ async def test_backend():
     print("\n2. Database:")
     try:
         db = Database()
-        settings = await db.get_all_settings()
+        settings = db.get_all_settings()
         print(f"   Database initialized successfully")
         print(f"   Settings: {settings}")
 
         # Test job creation
-        job_id = await db.new_job_id()
+        job_id = db.new_job_id()
         print(f"   Generated job ID: {job_id}")
     except Exception as e:
         print(f"   Database error: {e}")
@@ -91,18 +77,16 @@ async def test_backend():
     try:
         import importlib
 
-        for proto_base in ("backend.scribe_backend.proto", "scribe_backend.proto"):
-            try:
-                importlib.import_module(f"{proto_base}.scribe_pb2")
-                importlib.import_module(f"{proto_base}.scribe_pb2_grpc")
-                print("   [OK] Proto files imported successfully")
-                break
-            except ModuleNotFoundError:
-                continue
-        else:
+        proto_base = find_package(
+            ("backend.scribe_backend.proto", "scribe_backend.proto")
+        )
+        if proto_base is None:
             raise ModuleNotFoundError(
                 "Could not import proto modules from either 'backend.scribe_backend.proto' or 'scribe_backend.proto'"
             )
+        importlib.import_module(f"{proto_base}.scribe_pb2")
+        importlib.import_module(f"{proto_base}.scribe_pb2_grpc")
+        print("   [OK] Proto files imported successfully")
     except ImportError as e:
         print(f"   [FAIL] Proto import failed: {e}")
 
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Test the DAO's grouped writes and transactions against a temporary database"""
+
+import asyncio
+import os
+import tempfile
+from contextlib import contextmanager
+
+from _bootstrap import find_package
+
+
+def _load_database():
+    import importlib
+
+    base = find_package(("backend.scribe_backend", "scribe_backend"))
+    if base is None:
+        raise ModuleNotFoundError(
+            "Could not import backend modules from either 'backend.scribe_backend' or 'scribe_backend'"
+        )
+    return importlib.import_module(f"{base}.db.dao").Database
+
+
+Database = _load_database()
+
+
+@contextmanager
+def _temp_database():
+    """Yield a Database backed by a fresh file in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = os.environ.get("SCRIBE_DB_PATH")
+        os.environ["SCRIBE_DB_PATH"] = os.path.join(tmp, "scribe.db")
+        try:
+            db = Database()
+        finally:
+            if previous is None:
+                os.environ.pop("SCRIBE_DB_PATH", None)
+            else:
+                os.environ["SCRIBE_DB_PATH"] = previous
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+async def _check_group_commit():
+    with _temp_database() as db:
+        groups = []
+        run_group = db._run_group
+
+        def _counting_run_group(group):
+            groups.append(len(group))
+            return run_group(group)
+
+        db._run_group = _counting_run_group
+
+        # Issued in the same loop iteration, so they share one commit; the
+        # duplicate key fails on its own without undoing its neighbours.
+        results = await asyncio.gather(
+            db.create_job("job-a", "/audio/a.wav"),
+            db.create_job("job-a", "/audio/a.wav"),
+            db.create_job("job-b", "/audio/b.wav"),
+        )
+        assert results == [True, False, True], results
+        assert groups == [3], groups
+        assert (await db.get_job("job-a")) is not None
+        assert (await db.get_job("job-b")) is not None
+        print("   [OK] Concurrent writes share one commit; a failing write is isolated")
+
+
+async def _check_transaction():
+    with _temp_database() as db:
+        assert await db.create_job("job-tx", "/audio/tx.wav")
+
+        # Another task's write waits for the open transaction to finish.
+        opened = asyncio.Event()
+
+        async def _write_once_opened():
+            await opened.wait()
+            return await db.update_job_status("job-tx", 2)
+
+        other = asyncio.create_task(_write_once_opened())
+        async with db.transaction():
+            await db.insert_segments_batch(
+                "job-tx", [{"idx": 0, "start": 0.0, "end": 1.0, "text": "kept"}]
+            )
+            opened.set()
+            await asyncio.sleep(0.05)
+            assert not other.done(), "write from another task ran inside the transaction"
+        assert await other
+
+        # A block that raises rolls back only its own writes.
+        other = None
+        try:
+            async with db.transaction():
+                await db.insert_segments_batch(
+                    "job-tx", [{"idx": 1, "start": 1.0, "end": 2.0, "text": "dropped"}]
+                )
+                other = asyncio.create_task(db.update_job_progress("job-tx", 0.5))
+                await asyncio.sleep(0)
+                raise RuntimeError("abort transaction")
+        except RuntimeError:
+            pass
+        await other
+
+        segments = await db.get_segments("job-tx")
+        assert [s["text"] for s in segments] == ["kept"], segments
+        job = await db.get_job("job-tx")
+        assert job["status"] == 2, job
+        assert job["progress"] == 0.5, job
+        print("   [OK] Transactions serialize other writers and roll back on error")
+
+
+async def _check_transaction_gather():
+    with _temp_database() as db:
+        assert await db.create_job("job-gather", "/audio/gather.wav")
+
+        # Writes gathered inside the block run in child tasks, which would
+        # wait on the transaction that is waiting on them; they fail fast.
+        try:
+            async with db.transaction():
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        db.update_job_status("job-gather", 2),
+                        db.insert_segments_batch(
+                            "job-gather",
+                            [{"idx": 0, "start": 0.0, "end": 1.0, "text": "x"}],
+                        ),
+                    ),
+                    timeout=5.0,
+                )
+        except RuntimeError as e:
+            assert "transaction()" in str(e), e
+        else:
+            raise AssertionError("gathered writes inside transaction() did not raise")
+
+        # Once the block has closed, tasks it left behind write normally.
+        assert await db.update_job_status("job-gather", 2)
+        job = await db.get_job("job-gather")
+        assert job["status"] == 2, job
+        assert await db.get_segments("job-gather") == []
+        print("   [OK] Writes gathered inside a transaction raise instead of deadlocking")
+
+
+def test_group_commit():
+    asyncio.run(_check_group_commit())
+
+
+def test_transaction():
+    asyncio.run(_check_transaction())
+
+
+def test_transaction_gather():
+    asyncio.run(_check_transaction_gather())
+
+
+if __name__ == "__main__":
+    print("Database write tests:")
+    test_group_commit()
+    test_transaction()
+    test_transaction_gather()
@@ -2,60 +2,78 @@
 """Test if the server starts correctly"""
 
 import asyncio
-import sys
-from pathlib import Path
+import socket
 
-# Add project root and backend parent to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-BACKEND_ROOT = PROJECT_ROOT / "backend"
+import grpc
 
-# Ensure both runtime and type checkers can resolve imports
-for p in (PROJECT_ROOT, BACKEND_ROOT):
-    p_str = str(p)
-    if p_str not in sys.path:
-        sys.path.insert(0, p_str)
+from _bootstrap import find_package
+
+# How long the server may take to accept connections.
+_STARTUP_TIMEOUT = 10.0
 
 def _load_serve():
     import importlib
-    import importlib.util
-
-    for module_name in ("backend.scribe_backend.server", "scribe_backend.server"):
-        try:
-            module = importlib.import_module(module_name)
-            return module.serve
-        except ModuleNotFoundError:
-            continue
 
-    # Fallback if the package is exposed directly from backend/
-    server_path = BACKEND_ROOT / "server.py"
-    spec = importlib.util.spec_from_file_location("backend_server", server_path)
-    if spec is None or spec.loader is None:
-        raise ModuleNotFoundError(f"Could not load server module from {server_path}")
-    backend_server = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(backend_server)
-    return backend_server.serve
+    module_name = find_package(
+        ("backend.scribe_backend.server", "scribe_backend.server")
+    )
+    if module_name is None:
+        raise ModuleNotFoundError(
+            "Could not import server module from either 'backend.scribe_backend.server' or 'scribe_backend.server'"
+        )
+    return importlib.import_module(module_name).serve
 
 
 serve = _load_serve()
 
 
+def _free_port() -> int:
+    """Return a localhost port that is currently free."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
 async def test_server():
     """Test server startup"""
     print("Testing server startup...")
 
-    # Run for 2 seconds then stop (TimeoutError = server started successfully)
+    # A private port keeps a running backend on 50051 from answering the
+    # readiness probe in our place.
+    port = _free_port()
+    server_task = asyncio.create_task(serve(port=port))
+    channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+    ready_task = asyncio.create_task(channel.channel_ready())
+
     try:
-        await asyncio.wait_for(serve(), timeout=2.0)
-    except asyncio.TimeoutError:
-        print("Server started successfully (timed out as expected)")
-    except RuntimeError as e:
-        if "bind" in str(e).lower() or "50051" in str(e):
-            print("Port 50051 in use - skipping (stop backend or other process using the port)")
-            return
-        raise
+        done, _ = await asyncio.wait(
+            {server_task, ready_task},
+            timeout=_STARTUP_TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if server_task in done:
+            # serve() only returns once stopped; any exit here is a failure.
+            server_task.result()
+            raise RuntimeError("Server exited during startup")
+        if ready_task not in done:
+            raise asyncio.TimeoutError(
+                f"Server not ready after {_STARTUP_TIMEOUT:.0f}s"
+            )
+        print("Server started successfully (accepted a connection)")
     except Exception as e:
         print(f"Server error: {e}")
         raise
+    finally:
+        ready_task.cancel()
+        server_task.cancel()
+        await asyncio.gather(ready_task, server_task, return_exceptions=True)
+        await channel.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_server())
+    # Start the server on the same event loop main() uses in production.
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    run(test_server())